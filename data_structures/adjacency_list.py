@@ -1,41 +1,32 @@
+from data_structures.graph_parser import GraphStream
+
+
 def adjacency_list(graph_str):
     """
     Converts a graph description string into an adjacency list representation.
+
+    graph_str may also be a file object or mmap; it is parsed in chunks by
+    GraphStream, so large edge files need not be read into memory first.
     """
-    weighted = False
-    lines = graph_str.splitlines()          # Split the graph description into lines
-    first_line = lines[0].split()           # Parse the header line
-    
-    # Determine if the graph is directed
-    directed = first_line[0] == "D"
-    
-    # Determine if the graph is weighted (optional third token "W")
-    if len(first_line) > 2:
-        if first_line[2] == "W":
-            weighted = True
-    
-    # Number of vertices in the graph
-    num_vertices = int(first_line[1])
-    
+    stream = GraphStream(graph_str)         # Parses the header line
+    directed = stream.directed
+    weighted = stream.weighted
+
     # Initialize an empty adjacency list (outer list with an empty list for each vertex)
-    outer_list = [[] for _ in range(num_vertices)]
+    outer_list = [[] for _ in range(stream.num_vertices)]
     
-    # Process each edge line
-    for line in lines[1:]:
-        parts = list(line.split())
-        u, v = int(parts[0]), int(parts[1])    # Extract vertex indices
-        
-        # Extract weight if graph is weighted
-        weight = parts[2] if weighted and len(parts) > 2 else None
-        if weighted and weight is not None:
-            weight = int(weight)
+    # Process the edges one batch at a time
+    for us, vs, ws in stream.batches():
+        for i in range(len(us)):
+            u, v = us[i], vs[i]                    # Extract vertex indices
+            weight = ws[i] if weighted else None   # Extract weight if graph is weighted
         
-        # Add edge from u to v
-        outer_list[u].append((v, weight) if weighted else (v, None))
+            # Add edge from u to v
+            outer_list[u].append((v, weight))
         
-        # If undirected, add edge from v to u as well
-        if not directed:
-            outer_list[v].append((u, weight) if weighted else (u, None))
+            # If undirected, add edge from v to u as well
+            if not directed:
+                outer_list[v].append((u, weight))
             
     return outer_list
 
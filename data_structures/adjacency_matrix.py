@@ -1,50 +1,243 @@
-def adjacency_matrix(graph_str):
-    """Convert a graph string into an adjacency matrix.
+from data_structures.graph_parser import GraphStream
+
+HAS_NUMPY = True
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+
+
+class _BitRow:
+    """View of one row of a BitMatrix, indexed and iterated like a list of 0/1."""
+    def __init__(self, matrix, u):
+        self.matrix = matrix
+        self.u = u
+
+    def __len__(self):
+        return self.matrix.num_vertices
+
+    def __getitem__(self, v):
+        return self.matrix.get(self.u, v)
+
+    def __setitem__(self, v, value):
+        self.matrix.set(self.u, v, value)
+
+    def __iter__(self):
+        bits = self.matrix.row_bits(self.u)
+        for _ in range(self.matrix.num_vertices):
+            yield bits & 1
+            bits >>= 1
+
+
+class BitMatrix:
+    """
+    Bit-packed adjacency matrix for unweighted graphs: n^2 / 8 bytes.
+
+    Row u occupies row_bytes consecutive bytes of one bytearray, with bit v
+    set if there is an edge u -> v. row_bits(u) returns the row as a Python
+    int, so whole rows can be combined with | and & at C speed.
+    """
+    def __init__(self, num_vertices):
+        self.num_vertices = num_vertices
+        self.row_bytes = (num_vertices + 7) // 8
+        self.data = bytearray(self.row_bytes * num_vertices)
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __getitem__(self, u):
+        return _BitRow(self, u)
+
+    def __iter__(self):
+        for u in range(self.num_vertices):
+            yield _BitRow(self, u)
+
+    def get(self, u, v):
+        return (self.data[u * self.row_bytes + (v >> 3)] >> (v & 7)) & 1
+
+    def set(self, u, v, value=1):
+        i = u * self.row_bytes + (v >> 3)
+        if value:
+            self.data[i] |= 1 << (v & 7)
+        else:
+            self.data[i] &= ~(1 << (v & 7)) & 0xFF
+
+    def row_bits(self, u):
+        """Row u as an int: bit v is set iff there is an edge u -> v."""
+        start = u * self.row_bytes
+        return int.from_bytes(self.data[start:start + self.row_bytes], "little")
+
+    def neighbours(self, u):
+        """Yield the vertices v with an edge u -> v."""
+        bits = self.row_bits(u)
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def or_rows(self, vertices):
+        """Bitwise OR of the given rows: everything adjacent to any of them."""
+        result = 0
+        for u in vertices:
+            result |= self.row_bits(u)
+        return result
+
+    def and_rows(self, vertices):
+        """Bitwise AND of the given rows: everything adjacent to all of them."""
+        result = (1 << self.num_vertices) - 1
+        for u in vertices:
+            result &= self.row_bits(u)
+        return result
+
+    def reachable(self, start):
+        """Bitset of the vertices reachable from start (start included)."""
+        visited = frontier = 1 << start
+        while frontier:
+            # Expand the whole frontier at once by OR-ing its rows
+            reach = 0
+            bits = frontier
+            while bits:
+                low = bits & -bits
+                reach |= self.row_bits(low.bit_length() - 1)
+                bits ^= low
+            frontier = reach & ~visited
+            visited |= frontier
+        return visited
+
+
+class _SparseRow:
+    """One row of a SparseMatrix; missing entries read as the default value."""
+    def __init__(self, num_vertices, default):
+        self.entries = {}
+        self.num_vertices = num_vertices
+        self.default = default
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __getitem__(self, v):
+        return self.entries.get(v, self.default)
+
+    def __setitem__(self, v, value):
+        self.entries[v] = value
+
+    def __iter__(self):
+        get, default = self.entries.get, self.default
+        for v in range(self.num_vertices):
+            yield get(v, default)
+
+    def items(self):
+        """The stored (v, value) entries only."""
+        return self.entries.items()
+
+
+class SparseMatrix:
+    """
+    Dictionary-of-keys adjacency matrix: memory proportional to the number
+    of edges rather than n^2. Reads of absent entries give the default
+    (None for weighted graphs, 0 for unweighted).
     """
-    # Split the graph string into lines and read the first line
-    lines = graph_str.splitlines()
-    first_line = lines[0].split()
+    def __init__(self, num_vertices, default=None):
+        self.rows = [_SparseRow(num_vertices, default) for _ in range(num_vertices)]
 
-    # Determine if the graph is directed or undirected
-    directed = first_line[0] == "D"
-    
-    # Determine if the graph is weighted
-    weighted = len(first_line) > 2 and first_line[2] == "W"
+    def __len__(self):
+        return len(self.rows)
 
-    # Number of vertices in the graph
-    num_vertices = int(first_line[1])
+    def __getitem__(self, u):
+        return self.rows[u]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def neighbours(self, u):
+        """Yield the vertices v with an edge u -> v."""
+        return iter(self.rows[u].entries)
+
+
+def adjacency_matrix(graph_str, backend="list"):
+    """Convert a graph string (or file object / mmap) into an adjacency matrix.
+
+    Every backend supports matrix[u][v] lookups and iterating over a row:
+    - "list": list of lists (None / 0 for no edge), n^2 Python objects.
+    - "bits": BitMatrix of 0/1, unweighted graphs only, n^2 / 8 bytes.
+    - "numpy": dense NumPy array; weighted graphs use float64 with inf for
+      no edge, unweighted ones uint8 0/1. Needs NumPy.
+    - "sparse": SparseMatrix (dict of keys), memory proportional to edges.
+    """
+    # Read the header line; edges are streamed in batches below
+    stream = GraphStream(graph_str)
+    directed = stream.directed
+    weighted = stream.weighted
+    num_vertices = stream.num_vertices
 
     # Initialise adjacency matrix
-    if weighted:
-        # For weighted graphs: start with None (meaning no edge yet)
-        matrix = [[None] * num_vertices for _ in range(num_vertices)]
+    if backend == "list":
+        if weighted:
+            # For weighted graphs: start with None (meaning no edge yet)
+            matrix = [[None] * num_vertices for _ in range(num_vertices)]
+        else:
+            # For unweighted graphs: start with 0 (no edge)
+            matrix = [[0] * num_vertices for _ in range(num_vertices)]
+    elif backend == "bits":
+        if weighted:
+            raise ValueError("The 'bits' backend only supports unweighted graphs.")
+        matrix = BitMatrix(num_vertices)
+    elif backend == "numpy":
+        if not HAS_NUMPY:
+            raise ModuleNotFoundError("numpy is required for the 'numpy' backend.")
+        if weighted:
+            matrix = np.full((num_vertices, num_vertices), np.inf)
+        else:
+            matrix = np.zeros((num_vertices, num_vertices), dtype=np.uint8)
+    elif backend == "sparse":
+        matrix = SparseMatrix(num_vertices, None if weighted else 0)
     else:
-        # For unweighted graphs: start with 0 (no edge)
-        matrix = [[0] * num_vertices for _ in range(num_vertices)]
-
-    # Process each edge line in the input
-    for line in lines[1:]:
-        parts = line.split()
-        u, v = int(parts[0]), int(parts[1])
-        
-        # If weighted, parse the weight; otherwise default to 1
-        weight = int(parts[2]) if weighted else 1
-        
-        # Set edge from u to v
-        matrix[u][v] = weight
-        
-        # If undirected, also set edge from v to u
-        if not directed:
-            matrix[v][u] = weight
+        raise ValueError(f"Unknown backend {backend!r}; expected 'list', 'bits', 'numpy' or 'sparse'.")
+
+    # Process each batch of edges from the input
+    for us, vs, ws in stream.batches():
+        if backend == "numpy":
+            # Scatter the whole batch at once (later edges overwrite earlier ones)
+            rows, cols = np.asarray(us), np.asarray(vs)
+            values = np.asarray(ws) if weighted else np.ones(len(us), dtype=np.uint8)
+            if not directed:
+                # Interleave each edge with its reverse to keep input order
+                rows, cols = np.stack([rows, cols], 1).ravel(), np.stack([cols, rows], 1).ravel()
+                values = np.repeat(values, 2)
+            matrix[rows, cols] = values
+            continue
+        set_edge = matrix.set if backend == "bits" else None
+        for i in range(len(us)):
+            u, v = us[i], vs[i]
+
+            # If weighted, use the parsed weight; otherwise default to 1
+            weight = ws[i] if weighted else 1
+
+            # Set edge from u to v (and from v to u if undirected)
+            if set_edge is not None:
+                set_edge(u, v, weight)
+                if not directed:
+                    set_edge(v, u, weight)
+            else:
+                matrix[u][v] = weight
+                if not directed:
+                    matrix[v][u] = weight
 
     return matrix
 
 
 # Example usage:
-graph_string = """\
+if __name__ == "__main__":
+    graph_string = """\
 D 3 W
 0 1 7
 1 0 -2
 0 2 0
 """
-print(adjacency_matrix(graph_string))
+    print(adjacency_matrix(graph_string))
+    sparse = adjacency_matrix(graph_string, backend="sparse")
+    print(sparse[0][1], sparse[2][0])   # Expected: 7 None
+
+    bits = adjacency_matrix("D 3\n0 1\n1 2\n", backend="bits")
+    print([list(row) for row in bits])  # Expected: [[0, 1, 0], [0, 0, 1], [0, 0, 0]]
+    print(bin(bits.reachable(0)))       # Expected: 0b111
@@ -0,0 +1,221 @@
+from array import array
+from itertools import repeat
+from multiprocessing import shared_memory
+
+from data_structures.graph_parser import GraphStream
+
+
+class CSRGraph:
+    """
+    Compressed sparse row (CSR) graph.
+
+    The out-edges of vertex u are stored contiguously in
+    targets[offsets[u]:offsets[u + 1]] (and the matching slice of weights),
+    so a graph with E edges needs only three flat arrays instead of a Python
+    list of (v, weight) tuples per vertex.
+
+    Indexing behaves like an adjacency list: graph[u] yields (v, weight)
+    pairs, so code written for adjacency_list() accepts a CSRGraph as is.
+    Any buffer-like integer sequences (array, memoryview, NumPy arrays) can
+    be used for the three arrays.
+    """
+    def __init__(self, offsets, targets, weights=None, directed=True):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights      # None for unweighted graphs
+        self.directed = directed
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, u):
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        # zip reuses its result tuple when the caller unpacks it straight
+        # away, so iterating this does not allocate a tuple per edge.
+        if self.weights is None:
+            return zip(self.targets[lo:hi], repeat(None, hi - lo))
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def __iter__(self):
+        for u in range(len(self)):
+            yield self[u]
+
+    @property
+    def num_edges(self):
+        """Number of stored (directed) edges."""
+        return len(self.targets)
+
+    @property
+    def weighted(self):
+        return self.weights is not None
+
+    def neighbours(self, u):
+        """Return the targets of u's out-edges without their weights."""
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def degree(self, u):
+        """Out-degree of vertex u."""
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def transpose(self):
+        """Return a new CSRGraph with every edge reversed."""
+        if not self.directed:
+            return self  # Undirected graphs already store both directions
+        sources = array('i')
+        for u in range(len(self)):
+            sources.extend(repeat(u, self.degree(u)))
+        return csr_from_edges(len(self), self.targets, sources, self.weights, directed=True)
+
+
+def weight_typecode(weights):
+    """
+    Array typecode for a sequence of edge weights: 'q' if all are ints,
+    else 'd'. A 'q' or 'd' array keeps its own typecode without a scan.
+    """
+    if isinstance(weights, array) and weights.typecode in "qd":
+        return weights.typecode
+    return 'q' if all(isinstance(weight, int) for weight in weights) else 'd'
+
+
+def csr_from_edges(num_vertices, us, vs, ws=None, directed=True):
+    """
+    Build a CSRGraph from parallel sequences of edge endpoints (and weights).
+
+    If the graph is undirected each edge is stored in both directions. Edges
+    are placed with a counting sort on the source vertex, keeping their input
+    order within each vertex's neighbour list. Weights are stored as int64,
+    or as float64 if any weight is not an int.
+    """
+    # Count out-degrees
+    counts = array('q', [0]) * (num_vertices + 1)
+    for u in us:
+        counts[u + 1] += 1
+    if not directed:
+        for v in vs:
+            counts[v + 1] += 1
+
+    # Prefix sums give the start of each vertex's slice
+    for i in range(num_vertices):
+        counts[i + 1] += counts[i]
+    offsets = array('q', counts)
+
+    num_slots = counts[num_vertices]
+    targets = array('i', [0]) * num_slots
+    weights = array(weight_typecode(ws), [0]) * num_slots if ws is not None else None
+
+    # Distribute edges into place; counts[u] is u's next free slot
+    for i in range(len(us)):
+        u, v = us[i], vs[i]
+        slot = counts[u]
+        counts[u] += 1
+        targets[slot] = v
+        if weights is not None:
+            weights[slot] = ws[i]
+        if not directed:
+            slot = counts[v]
+            counts[v] += 1
+            targets[slot] = u
+            if weights is not None:
+                weights[slot] = ws[i]
+
+    return CSRGraph(offsets, targets, weights, directed)
+
+
+def csr_from_adjacency_list(adj_list, directed=True):
+    """
+    Convert a list-of-lists adjacency list into a CSRGraph. Weights are
+    stored as int64, or as float64 if any weight is not an int.
+    """
+    offsets = array('q', [0])
+    targets = array('i')
+    weights = []
+    weighted = False
+    for edges in adj_list:
+        for v, weight in edges:
+            targets.append(v)
+            if weight is not None:
+                weighted = True
+                weights.append(weight)
+            else:
+                weights.append(0)
+        offsets.append(len(targets))
+    return CSRGraph(offsets, targets, array(weight_typecode(weights), weights) if weighted else None, directed)
+
+
+def csr_graph(graph_str):
+    """
+    Converts a graph description string (or file object / mmap) into a CSRGraph.
+
+    Uses the same "D|U num_vertices [W]" header and "u v [weight]" edge lines
+    as adjacency_list(). Edges are streamed in batches straight into flat
+    arrays, so no per-edge tuples are created.
+    """
+    stream = GraphStream(graph_str)
+    us, vs = array('i'), array('i')
+    ws = array('q') if stream.weighted else None
+    for batch_us, batch_vs, batch_ws in stream.batches():
+        us.extend(batch_us)
+        vs.extend(batch_vs)
+        if ws is not None:
+            ws.extend(batch_ws)
+
+    return csr_from_edges(stream.num_vertices, us, vs, ws, stream.directed)
+
+
+def share_csr(graph):
+    """
+    Copy a CSRGraph's arrays into shared memory blocks.
+
+    Returns (blocks, spec): keep blocks alive (and close()/unlink() them when
+    done) in the owning process, and pass the small picklable spec to other
+    processes, which open the same memory with attach_csr(spec).
+    """
+    blocks = []
+    spec = {"directed": graph.directed}
+    parts = [("offsets", 'q', graph.offsets), ("targets", 'i', graph.targets)]
+    if graph.weights is not None:
+        parts.append(("weights", weight_typecode(graph.weights), graph.weights))
+    for name, typecode, values in parts:
+        values = array(typecode, values)
+        num_bytes = len(values) * values.itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(values.itemsize, num_bytes))
+        block.buf[:num_bytes] = values.tobytes()
+        blocks.append(block)
+        spec[name] = (block.name, typecode, len(values))
+    return blocks, spec
+
+
+def attach_csr(spec):
+    """
+    Open a CSRGraph whose arrays were placed in shared memory by share_csr().
+
+    Returns (blocks, graph); the graph reads the shared buffers directly,
+    without copying. Keep blocks referenced for as long as graph is used.
+    """
+    blocks = []
+    arrays = {}
+    for name in ("offsets", "targets", "weights"):
+        if name not in spec:
+            arrays[name] = None
+            continue
+        block_name, typecode, length = spec[name]
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = block.buf.cast(typecode)[:length]
+    graph = CSRGraph(arrays["offsets"], arrays["targets"], arrays["weights"], spec["directed"])
+    return blocks, graph
+
+
+# --- test ---
+if __name__ == "__main__":
+    # Same undirected, unweighted graph as the adjacency_list example
+    graph_description = """\
+U 3
+0 1
+1 2
+"""
+    graph = csr_graph(graph_description)
+    print("Offsets:", list(graph.offsets))   # Expected: [0, 1, 3, 4]
+    print("Targets:", list(graph.targets))   # Expected: [1, 0, 2, 1]
+    print("As lists:", [list(edges) for edges in graph])
+    # Expected: [[(1, None)], [(0, None), (2, None)], [(1, None)]]
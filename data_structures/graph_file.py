@@ -0,0 +1,128 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from data_structures.csr_graph import CSRGraph, csr_from_adjacency_list, csr_graph, weight_typecode
+
+# File layout (all little-endian):
+#   64-byte header: magic, format version, flags, num_vertices, num_edges
+#   offsets: (num_vertices + 1) int64
+#   targets: num_edges int32, zero-padded to a multiple of 8 bytes
+#   weights: num_edges int64, or float64 with the float flag (only if the weighted flag is set)
+MAGIC = b"CSRGRAPH"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")
+HEADER_SIZE = 64
+FLAG_DIRECTED = 1
+FLAG_WEIGHTED = 2
+FLAG_FLOAT_WEIGHTS = 4
+
+
+def _padded(num_bytes):
+    return (num_bytes + 7) // 8 * 8
+
+
+def _write_array(outfile, values, typecode):
+    values = values if isinstance(values, array) and values.typecode == typecode else array(typecode, values)
+    if sys.byteorder == "big":
+        values = array(typecode, values)
+        values.byteswap()
+    values.tofile(outfile)
+    return len(values) * values.itemsize
+
+
+def save_graph(graph, filename):
+    """
+    Write a graph (CSRGraph or adjacency list) to a binary CSR file that
+    load_graph() can open without parsing.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = csr_from_adjacency_list(graph)
+    weights_typecode = weight_typecode(graph.weights) if graph.weights is not None else 'q'
+    flags = ((FLAG_DIRECTED if graph.directed else 0) | (FLAG_WEIGHTED if graph.weights is not None else 0)
+             | (FLAG_FLOAT_WEIGHTS if weights_typecode == 'd' else 0))
+    with open(filename, "wb") as outfile:
+        outfile.write(HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(graph), graph.num_edges)
+                      .ljust(HEADER_SIZE, b"\0"))
+        _write_array(outfile, graph.offsets, 'q')
+        written = _write_array(outfile, graph.targets, 'i')
+        outfile.write(b"\0" * (_padded(written) - written))
+        if graph.weights is not None:
+            _write_array(outfile, graph.weights, weights_typecode)
+
+
+def load_graph(filename, use_mmap=True):
+    """
+    Open a graph written by save_graph().
+
+    With use_mmap the returned CSRGraph's arrays are memoryviews straight
+    onto a read-only memory map of the file: nothing is parsed or copied,
+    pages are only read from disk when touched, and separate processes that
+    load the same file share one copy through the OS page cache. Otherwise
+    the arrays are read into memory.
+    """
+    with open(filename, "rb") as infile:
+        header = infile.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"{filename!r} is too short to be a graph file.")
+        magic, version, flags, num_vertices, num_edges = HEADER.unpack_from(header)
+        if magic != MAGIC:
+            raise ValueError(f"{filename!r} is not a graph file (bad magic number).")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported graph file version {version}; expected {FORMAT_VERSION}.")
+        weighted = bool(flags & FLAG_WEIGHTED)
+
+        # (name, typecode, count, byte offset) of each array section
+        sections = []
+        position = HEADER_SIZE
+        for name, typecode, count in (("offsets", 'q', num_vertices + 1),
+                                      ("targets", 'i', num_edges),
+                                      ("weights", 'd' if flags & FLAG_FLOAT_WEIGHTS else 'q',
+                                       num_edges if weighted else 0)):
+            sections.append((name, typecode, count, position))
+            position += _padded(count * array(typecode).itemsize)
+
+        arrays = {"weights": None}
+        if use_mmap and sys.byteorder == "little":
+            mapped = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(mapped) < position:
+                raise ValueError(f"{filename!r} is truncated.")
+            view = memoryview(mapped)
+            for name, typecode, count, start in sections:
+                if name == "weights" and not weighted:
+                    continue
+                size = array(typecode).itemsize
+                arrays[name] = view[start:start + count * size].cast(typecode)
+        else:
+            for name, typecode, count, start in sections:
+                if name == "weights" and not weighted:
+                    continue
+                infile.seek(start)
+                values = array(typecode)
+                values.fromfile(infile, count)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                arrays[name] = values
+
+    return CSRGraph(arrays["offsets"], arrays["targets"], arrays["weights"],
+                    directed=bool(flags & FLAG_DIRECTED))
+
+
+# --- Test ---
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    graph_description = """\
+D 3 W
+0 1 7
+1 0 -2
+0 2 0
+"""
+    path = os.path.join(tempfile.mkdtemp(), "example.csrg")
+    save_graph(csr_graph(graph_description), path)
+    graph = load_graph(path)
+    print([list(edges) for edges in graph])  # Expected: [[(1, 7), (2, 0)], [(0, -2)], []]
+    save_graph([[(1, 0.5)], []], path)
+    print(list(load_graph(path, use_mmap=False)[0]))   # Expected: [(1, 0.5)]
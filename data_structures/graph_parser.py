@@ -0,0 +1,153 @@
+from array import array
+
+DEFAULT_CHUNK_SIZE = 1 << 20    # Characters/bytes read from the source at a time
+
+
+def _chunks(source, chunk_size):
+    """Yield successive pieces of a string, bytes, file object or mmap."""
+    if hasattr(source, "read"):
+        # File objects and mmap objects both support read(size)
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for i in range(0, len(source), chunk_size):
+            yield source[i:i + chunk_size]
+
+
+def is_graph_source(obj):
+    """True if obj is something GraphStream can parse (rather than a built graph)."""
+    return isinstance(obj, (str, bytes, bytearray)) or hasattr(obj, "read")
+
+
+class GraphStream:
+    """
+    Streaming parser for the "D|U num_vertices [W]" graph text format.
+
+    The header is read as soon as the stream is created; the edges are then
+    produced by batches() as parallel arrays (us, vs, ws), one batch per
+    chunk of input, so the whole description never has to be held in memory
+    as a string or a list of lines.
+
+    source may be a string, bytes, a text or binary file object, or an mmap.
+    """
+    def __init__(self, source, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._chunks = _chunks(source, chunk_size)
+        self._tail = None
+
+        # Read until the end of the header line
+        buffer = None
+        for chunk in self._chunks:
+            buffer = chunk if buffer is None else buffer + chunk
+            if buffer.find(self._newline(buffer)) != -1:
+                break
+        if not buffer or not buffer.strip():
+            raise ValueError("Graph description is empty; expected a 'D|U n [W]' header.")
+
+        newline = self._newline(buffer)
+        end = buffer.find(newline)
+        if end == -1:
+            end = len(buffer)
+        header = buffer[:end]
+        if not isinstance(header, str):
+            header = bytes(header).decode("ascii")
+        self._tail = buffer[end + 1:]
+
+        first_line = header.split()
+        if len(first_line) < 2 or first_line[0] not in ("D", "U"):
+            raise ValueError(f"Invalid graph header {header!r}; expected 'D|U n [W]'.")
+        self.directed = first_line[0] == "D"
+        self.num_vertices = int(first_line[1])
+        self.weighted = len(first_line) > 2 and first_line[2] == "W"
+
+    @staticmethod
+    def _newline(chunk):
+        return "\n" if isinstance(chunk, str) else b"\n"
+
+    def batches(self):
+        """
+        Yield (us, vs, ws) array batches of edges; ws is None if unweighted.
+
+        Can only be iterated once, as it consumes the underlying source.
+        """
+        tail = self._tail
+        self._tail = None
+        if tail is None:
+            return
+
+        for chunk in self._chunks:
+            block = tail + chunk
+            # Only parse complete lines; keep the partial last line for later
+            cut = block.rfind(self._newline(block)) + 1
+            tail = block[cut:]
+            if cut:
+                yield self._parse_block(block[:cut])
+
+        if tail and tail.strip():
+            yield self._parse_block(tail)
+
+    def _parse_block(self, block):
+        """Parse a block of complete edge lines into arrays."""
+        stride = 3 if self.weighted else 2
+        tokens = block.split()
+        # Tokens per line, counted in C; only blank lines and lines with
+        # exactly stride values may take the fast path
+        line_lengths = set(map(len, map(type(block).split, block.splitlines())))
+
+        if line_lengths <= {0, stride}:
+            # Fast path: one edge per line, so the flat token list can be
+            # sliced into columns and converted in bulk.
+            us = array('i', map(int, tokens[0::stride]))
+            vs = array('i', map(int, tokens[1::stride]))
+            ws = array('q', map(int, tokens[2::stride])) if self.weighted else None
+        else:
+            us, vs = array('i'), array('i')
+            ws = array('q') if self.weighted else None
+            for line in block.splitlines():
+                parts = line.split()
+                if not parts:
+                    continue  # Blank lines are allowed
+                if len(parts) < stride:
+                    raise ValueError(f"Malformed edge line {line!r}; expected {stride} values.")
+                us.append(int(parts[0]))
+                vs.append(int(parts[1]))
+                if self.weighted:
+                    ws.append(int(parts[2]))
+
+        self._check_vertices(us)
+        self._check_vertices(vs)
+        return us, vs, ws
+
+    def _check_vertices(self, ids):
+        if ids and (min(ids) < 0 or max(ids) >= self.num_vertices):
+            bad = min(ids) if min(ids) < 0 else max(ids)
+            raise ValueError(f"Vertex id {bad} out of range for a graph with "
+                             f"{self.num_vertices} vertices.")
+
+    def edges(self):
+        """Yield (u, v, weight) for every edge; weight is None if unweighted."""
+        for us, vs, ws in self.batches():
+            if ws is None:
+                for i in range(len(us)):
+                    yield us[i], vs[i], None
+            else:
+                yield from zip(us, vs, ws)
+
+
+# --- test ---
+if __name__ == "__main__":
+    import io
+
+    graph_description = """\
+D 3 W
+0 1 7
+1 0 -2
+0 2 0
+"""
+    stream = GraphStream(io.BytesIO(graph_description.encode()), chunk_size=8)
+    print("Directed:", stream.directed, "Vertices:", stream.num_vertices,
+          "Weighted:", stream.weighted)
+    print("Edges:", list(stream.edges()))
+    # Expected: [(0, 1, 7), (1, 0, -2), (0, 2, 0)]
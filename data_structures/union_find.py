@@ -0,0 +1,98 @@
+from array import array
+
+
+class UnionFind:
+    """
+    Array-backed union–find (disjoint set) structure over vertices 0..n-1.
+
+    Uses union by rank and path compression, so any sequence of m operations
+    takes O(m α(n)) time, effectively constant per operation. Edges can be
+    added in batches, with component queries answered in between.
+    """
+    def __init__(self, num_vertices):
+        self.parent = array('i', range(num_vertices))   # parent[v] == v for roots
+        self.rank = bytearray(num_vertices)             # Upper bound on tree height
+        self.count = num_vertices                       # Number of components
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, v):
+        """Return the representative (root) of v's component."""
+        parent = self.parent
+        root = v
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression: point everything on the path straight at the root
+        while parent[v] != root:
+            parent[v], v = root, parent[v]
+        return root
+
+    def union(self, u, v):
+        """Merge the components of u and v. Returns False if already merged."""
+        root_u, root_v = self.find(u), self.find(v)
+        if root_u == root_v:
+            return False
+        rank = self.rank
+        # Union by rank: hang the shorter tree under the taller one
+        if rank[root_u] < rank[root_v]:
+            root_u, root_v = root_v, root_u
+        self.parent[root_v] = root_u
+        if rank[root_u] == rank[root_v]:
+            rank[root_u] += 1
+        self.count -= 1
+        return True
+
+    def add_edges(self, batch):
+        """Add a batch of (u, v) edges (extra items such as weights are ignored)."""
+        union = self.union
+        for edge in batch:
+            union(edge[0], edge[1])
+
+    def add_edge_arrays(self, us, vs):
+        """Add the edges us[i]--vs[i], as produced by GraphStream.batches()."""
+        union = self.union
+        for u, v in zip(us, vs):
+            union(u, v)
+
+    def component_of(self, v):
+        """Identifier of v's component (its representative vertex)."""
+        return self.find(v)
+
+    def same_component(self, u, v):
+        """True if u and v are connected by the edges added so far."""
+        return self.find(u) == self.find(v)
+
+    def labels(self):
+        """
+        Label every vertex with a component number 0..count-1, numbered in
+        order of each component's smallest vertex.
+        """
+        n = len(self.parent)
+        labels = array('i', [-1]) * n
+        root_label = array('i', [-1]) * n
+        next_label = 0
+        for v in range(n):
+            root = self.find(v)
+            if root_label[root] == -1:
+                root_label[root] = next_label
+                next_label += 1
+            labels[v] = root_label[root]
+        return labels
+
+    def components(self):
+        """Return the components as a list of sets of vertices."""
+        groups = {}
+        for v in range(len(self.parent)):
+            groups.setdefault(self.find(v), set()).add(v)
+        return list(groups.values())
+
+
+# --- test ---
+if __name__ == "__main__":
+    uf = UnionFind(5)
+    uf.add_edges([(0, 1), (3, 4)])
+    print(uf.same_component(0, 1), uf.same_component(1, 2))   # Expected: True False
+    uf.add_edges([(1, 2)])
+    print(uf.same_component(0, 2), uf.count)                   # Expected: True 2
+    print(list(uf.labels()))                                   # Expected: [0, 0, 0, 1, 1]
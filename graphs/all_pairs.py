@@ -0,0 +1,162 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from data_structures.csr_graph import CSRGraph, attach_csr, csr_from_adjacency_list, share_csr, weight_typecode
+from graphs.bellman_ford import johnson_potentials
+from graphs.dijkstra import dijkstra
+from graphs.floyd_warshall import HAS_NUMPY, floyd, has_negative_cycle, initial_distance_matrix
+
+INFINITY = float('inf')
+
+# Graphs with at least this fraction of the n^2 possible edges use Floyd–Warshall
+DENSE_FRACTION = 0.1
+
+
+def _reweighted(graph, h):
+    """Return a copy of a CSR graph with Johnson's non-negative weights."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    new_weights = array(weight_typecode(weights), weights)
+    for u in range(len(graph)):
+        for i in range(offsets[u], offsets[u + 1]):
+            new_weights[i] += h[u] - h[targets[i]]
+    return CSRGraph(offsets, targets, new_weights, graph.directed)
+
+
+def _dijkstra_row(graph, source, h):
+    """Distances from source, undoing the Johnson reweighting if h is given."""
+    _, distance = dijkstra(graph, source)
+    if h is not None:
+        h_s = h[source]
+        distance = [d if d == INFINITY else d - h_s + h[v] for v, d in enumerate(distance)]
+    return distance
+
+
+# Per-process state, set up once in each worker by _init_worker
+_worker = {}
+
+
+def _init_worker(spec, result_name, h):
+    """Attach to the shared graph and result matrix (no copying or pickling)."""
+    blocks, graph = attach_csr(spec)
+    result = shared_memory.SharedMemory(name=result_name)
+    _worker.update(blocks=blocks + [result], graph=graph, h=h,
+                   result=result.buf.cast('d'))
+
+
+def _worker_task(sources):
+    """Run Dijkstra from each source, writing rows straight into the result matrix."""
+    graph, result, h = _worker["graph"], _worker["result"], _worker["h"]
+    n = len(graph)
+    for s in sources:
+        result[s * n:(s + 1) * n] = array('d', _dijkstra_row(graph, s, h))
+    return len(sources)
+
+
+def _parallel_rows(graph, h, workers):
+    """Fan the sources out over a process pool, sharing the graph read-only."""
+    n = len(graph)
+    blocks, spec = share_csr(graph)
+    result = shared_memory.SharedMemory(create=True, size=max(8, n * n * 8))
+    try:
+        # A few chunks per worker keeps them all busy without much task overhead
+        chunk = max(1, n // (workers * 4))
+        chunks = [range(lo, min(lo + chunk, n)) for lo in range(0, n, chunk)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(spec, result.name, h)) as pool:
+            for _ in pool.map(_worker_task, chunks):
+                pass
+        view = result.buf.cast('d')
+        rows = [view[s * n:(s + 1) * n].tolist() for s in range(n)]
+        view.release()
+        return rows
+    finally:
+        for block in blocks + [result]:
+            block.close()
+            block.unlink()
+
+
+def all_pairs_shortest_paths(graph, workers=1, method="auto"):
+    """
+    Computes the matrix of shortest distances between every pair of vertices.
+
+    graph is an adjacency list or CSRGraph; weights may be ints or floats,
+    and unweighted graphs count hops. Returns a list-of-lists matrix like
+    floyd(), with inf for unreachable pairs; distances are ints when every
+    weight is an int. Raises ValueError if the graph has a negative cycle.
+
+    Notes
+    -----
+    - method="floyd" runs Floyd–Warshall, O(n^3), good for dense graphs.
+    - method="dijkstra" runs Dijkstra from every source, O(n E log n), good
+      for sparse graphs. Negative weights are handled with Johnson's
+      reweighting (one SPFA Bellman–Ford pass to make all weights non-negative).
+    - method="auto" picks Floyd–Warshall when the graph has at least
+      DENSE_FRACTION * n^2 edges, Dijkstra otherwise.
+    - With workers > 1 the Dijkstra sources are spread over a process pool.
+      The graph and the result matrix live in shared memory, so neither is
+      pickled per task.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = csr_from_adjacency_list(graph)
+    if graph.weights is None:
+        graph = CSRGraph(graph.offsets, graph.targets, array('q', [1]) * graph.num_edges,
+                         graph.directed)
+    n = len(graph)
+    integral = weight_typecode(graph.weights) == 'q'
+
+    if method == "auto":
+        method = "floyd" if graph.num_edges >= DENSE_FRACTION * n * n else "dijkstra"
+
+    if method == "floyd":
+        distances = floyd(initial_distance_matrix(graph), method="numpy" if HAS_NUMPY and n else "python")
+        if has_negative_cycle(distances):
+            raise ValueError("Graph contains a negative cycle; shortest paths are undefined.")
+    elif method == "dijkstra":
+        h = None
+        if any(weight < 0 for weight in graph.weights):
+            h = johnson_potentials(graph)
+            graph = _reweighted(graph, h)
+        if workers > 1 and n > 1:
+            distances = _parallel_rows(graph, h, workers)
+        else:
+            distances = [_dijkstra_row(graph, s, h) for s in range(n)]
+    else:
+        raise ValueError(f"Unknown method {method!r}; expected 'auto', 'floyd' or 'dijkstra'.")
+
+    if not integral:
+        return distances
+    # NumPy and shared memory hand back floats even when every weight is an int
+    return [[d if d == INFINITY else int(d) for d in row] for row in distances]
+
+
+# --- Test ---
+if __name__ == "__main__":
+    # Directed weighted graph with a negative edge (but no negative cycle)
+    graph_str = """\
+D 4 W
+0 1 4
+0 2 1
+2 1 -2
+1 3 1
+"""
+    adj_graph = adjacency_list(graph_str)
+    print(all_pairs_shortest_paths(adj_graph, method="floyd"))
+    print(all_pairs_shortest_paths(adj_graph, method="dijkstra"))
+    print(all_pairs_shortest_paths(adj_graph, method="dijkstra", workers=2))
+    # Expected (all three): [[0, -1, 1, 0], [inf, 0, inf, 1], [inf, -2, 0, -1], [inf, inf, inf, 0]]
+
+    # Parallel edges and a self-loop: the cheapest edge counts, and the
+    # loop doesn't lengthen the trip from 0 to itself
+    multigraph = adjacency_list("D 2 W\n0 1 3\n0 1 5\n0 0 5\n")
+    print(all_pairs_shortest_paths(multigraph, method="floyd"))
+    print(all_pairs_shortest_paths(multigraph, method="dijkstra"))
+    # Expected (both): [[0, 3], [inf, 0]]
+
+    # Float weights are kept as floats
+    floats = [[(1, 0.5)], [(2, 0.25)], []]
+    print(all_pairs_shortest_paths(floats, method="dijkstra"))
+    # Expected: [[0, 0.5, 0.75], [inf, 0, 0.25], [inf, inf, 0]]
+    print(all_pairs_shortest_paths(floats, method="floyd") == all_pairs_shortest_paths(floats, method="dijkstra"))
+    # Expected: True
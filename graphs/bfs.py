@@ -1,5 +1,7 @@
+from array import array
 from collections import deque
 from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from data_structures.csr_graph import CSRGraph, csr_from_adjacency_list
 
 
 def bfs_tree(adj_list, start):
@@ -28,6 +30,78 @@ def bfs_tree(adj_list, start):
     return parent_array
 
 
+def bfs_levels(graph, start, alpha=14, beta=24, transpose=None):
+    """
+    Level-synchronous, direction-optimizing BFS.
+
+    Returns (parent, distance) as int arrays, with -1 for the start's parent
+    and for vertices that are not reachable.
+
+    Notes
+    -----
+    - Each level is expanded either top-down (scan the out-edges of the
+      frontier) or bottom-up (each unvisited vertex scans its in-edges and
+      stops at the first one from the frontier). Bottom-up wins when the
+      frontier is a large part of the graph, as on low-diameter graphs.
+    - Switch to bottom-up once the frontier's edges exceed 1/alpha of the
+      unvisited vertices' edges, and back to top-down once the frontier
+      shrinks below n/beta vertices (Beamer et al.'s heuristic).
+    - graph should be a CSRGraph; adjacency lists are converted first. For
+      directed graphs the in-edges come from graph.transpose(), which can
+      be passed in as transpose to reuse it between calls.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = csr_from_adjacency_list(graph)
+    n = len(graph)
+    offsets, targets = graph.offsets, graph.targets
+    if transpose is None:
+        transpose = graph.transpose()
+    in_offsets, in_sources = transpose.offsets, transpose.targets
+
+    parent = array('i', [-1]) * n
+    distance = array('i', [-1]) * n
+    distance[start] = 0
+
+    frontier = [start]
+    edges_to_check = graph.num_edges - graph.degree(start)  # Edges out of unvisited vertices
+    bottom_up = False
+    level = 0
+    while frontier:
+        level += 1
+        frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+        if not bottom_up and frontier_edges > edges_to_check / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        next_frontier = []
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            for v in range(n):
+                if distance[v] != -1:
+                    continue
+                for u in in_sources[in_offsets[v]:in_offsets[v + 1]]:
+                    if in_frontier[u]:
+                        parent[v] = u
+                        distance[v] = level
+                        next_frontier.append(v)
+                        break  # Any frontier parent will do
+        else:
+            for u in frontier:
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    if distance[v] == -1:
+                        parent[v] = u
+                        distance[v] = level
+                        next_frontier.append(v)
+
+        edges_to_check -= sum(offsets[v + 1] - offsets[v] for v in next_frontier)
+        frontier = next_frontier
+
+    return parent, distance
+
+
 # --- Test ---
 if __name__ == "__main__":
     # Simple directed, weighted graph with 2 vertices and one edge 0 -> 1 (weight 99)
@@ -37,3 +111,7 @@ D 2 W
 """
     # Build adjacency list, then run BFS starting from vertex 0
     print(bfs_tree(adjacency_list(graph_string), 0))  # Expected output: [None, 0]
+
+    # Level-synchronous version returns parent and distance arrays
+    parent, distance = bfs_levels(adjacency_list(graph_string), 0)
+    print(list(parent), list(distance))  # Expected output: [-1, 0] [0, 1]
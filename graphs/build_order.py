@@ -1,50 +1,162 @@
+from array import array
+
+from data_structures.adjacency_list import adjacency_list
+from data_structures.graph_parser import is_graph_source
+
+
+def _as_graph(dependencies):
+    """Parse a graph description, or pass an already built graph through."""
+    if is_graph_source(dependencies):
+        return adjacency_list(dependencies)
+    return dependencies
+
+
+def _kahn_levels(graph):
+    """
+    Kahn's algorithm, one level at a time.
+
+    Returns (levels, remaining): levels[i] holds the vertices whose
+    dependencies all lie in earlier levels, and remaining is the number of
+    vertices that could never be scheduled (non-zero iff there is a cycle).
+    """
+    n = len(graph)
+    indegree = array('i', [0]) * n
+    for u in range(n):
+        for v, _ in graph[u]:
+            indegree[v] += 1
+
+    # Start with every vertex that has no dependencies
+    level = [v for v in range(n) if indegree[v] == 0]
+    levels = []
+    remaining = n
+    while level:
+        levels.append(level)
+        remaining -= len(level)
+        next_level = []
+        for u in level:
+            for v, _ in graph[u]:
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    next_level.append(v)  # Last dependency of v just got built
+        level = next_level
+    return levels, remaining
+
+
 def build_order(dependencies):
     """
     Computes a valid build order (topological sort) for a directed graph.
+
+    Accepts either a graph description (string, file object or mmap) or an
+    already built directed graph (an adjacency list or a CSRGraph).
+    Returns None if the graph has a cycle, since then no order exists.
+    """
+    levels, remaining = _kahn_levels(_as_graph(dependencies))
+    if remaining:
+        return None
+    return [v for level in levels for v in level]
+
+
+def build_levels(dependencies):
+    """
+    Groups a build order into levels: every vertex in a level depends only
+    on vertices in earlier levels, so each level can be built concurrently.
+
+    Returns a list of lists, or None if the graph has a cycle.
+    """
+    levels, remaining = _kahn_levels(_as_graph(dependencies))
+    if remaining:
+        return None
+    return levels
+
+
+def find_cycle(dependencies):
+    """
+    Returns the vertices of one cycle (in edge order), or None if the graph
+    is acyclic.
+    """
+    graph = _as_graph(dependencies)
+    levels, remaining = _kahn_levels(graph)
+    if not remaining:
+        return None
+
+    # Every vertex Kahn could not schedule has a dependency that also could
+    # not be scheduled, so walking those dependencies backwards must loop.
+    scheduled = bytearray(len(graph))
+    for level in levels:
+        for v in level:
+            scheduled[v] = 1
+    pred = array('i', [-1]) * len(graph)
+    for u in range(len(graph)):
+        if not scheduled[u]:
+            for v, _ in graph[u]:
+                if not scheduled[v]:
+                    pred[v] = u
+
+    v = scheduled.index(0)
+    seen_at = {}
+    walk = []
+    while v not in seen_at:
+        seen_at[v] = len(walk)
+        walk.append(v)
+        v = pred[v]
+    return walk[seen_at[v]:][::-1]
+
+
+def critical_path(dependencies, costs):
+    """
+    Finds the critical path: the chain of dependent builds with the largest
+    total cost, which bounds the build time however many run in parallel.
+
+    costs[v] is the cost of building vertex v. Returns (total_cost, path),
+    or None if the graph has a cycle.
     """
-    # Split into lines and parse the first line to get number of vertices
-    lines = dependencies.splitlines()
-    first_line = lines[0].split()
-    num_vertices = int(first_line[1])
-
-    # Build adjacency list as a dictionary
-    graph = {}
-    for line in lines[1:]:
-        parts = line.split()
-        u, v = int(parts[0]), int(parts[1])
-        if u not in graph:
-            graph[u] = []
-        graph[u].append(v)
-
-    # State array for DFS: "U" = unvisited, "D" = visiting, "P" = processed
-    states = ['U'] * num_vertices
-    results = []
-
-    def dfs(graph, i, states, results):
-        """Recursive DFS that adds vertices to results after exploring children."""
-        states[i] = "D"  # Mark as visiting
-        for v in graph.get(i, []):
-            if states[v] == "U": 
-                dfs(graph, v, states, results)
-        states[i] = "P"  # Mark as processed
-        results.append(i)
-
-    # Run DFS from all unvisited vertices to cover disconnected components
-    for i in range(num_vertices):
-        if states[i] == "U":
-            dfs(graph, i, states, results)
-
-    # Reverse results to get correct topological order
-    return results[::-1]
+    graph = _as_graph(dependencies)
+    levels, remaining = _kahn_levels(graph)
+    if remaining:
+        return None
+
+    n = len(graph)
+    start = [0] * n        # Earliest time v can start (all dependencies done)
+    pred = [None] * n      # Dependency that finishes last, on the critical path
+    best = None
+    for level in levels:
+        for u in level:
+            finish = start[u] + costs[u]
+            if best is None or finish > start[best] + costs[best]:
+                best = u
+            for v, _ in graph[u]:
+                if finish > start[v] or pred[v] is None:
+                    start[v] = finish
+                    pred[v] = u
+
+    if best is None:
+        return 0, []
+    path = [best]
+    while pred[path[-1]] is not None:
+        path.append(pred[path[-1]])
+    return start[best] + costs[best], path[::-1]
 
 
 # --- Test ---
-dependencies = """\
+if __name__ == "__main__":
+    dependencies = """\
 D 3
 """
-# Any permutation of [0, 1, 2] is valid when there are no edges
-solution = build_order(dependencies)
-if solution is None:
-    print("Wrong answer!")
-else:
-    print(sorted(solution))  # Expected: [0, 1, 2]
+    # Any permutation of [0, 1, 2] is valid when there are no edges
+    solution = build_order(dependencies)
+    if solution is None:
+        print("Wrong answer!")
+    else:
+        print(sorted(solution))  # Expected: [0, 1, 2]
+
+    dependencies = """\
+D 4
+0 1
+0 2
+1 3
+2 3
+"""
+    print(build_levels(dependencies))                 # Expected: [[0], [1, 2], [3]]
+    print(critical_path(dependencies, [1, 5, 2, 1]))  # Expected: (7, [0, 1, 3])
+    print(build_order("D 2\n0 1\n1 0\n"))             # Expected: None (cycle)
+    print(find_cycle("D 3\n0 1\n1 2\n2 1\n"))         # Expected: [2, 1]
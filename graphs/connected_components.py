@@ -1,47 +1,81 @@
-def connected_components(physical_contact_info):
+from data_structures.csr_graph import CSRGraph
+from data_structures.graph_parser import GraphStream, is_graph_source
+from data_structures.union_find import UnionFind
+from graphs.dfs import dfs_visit
+
+
+def _union_find(physical_contact_info):
+    """Build a UnionFind from a graph description or a built graph."""
+    if is_graph_source(physical_contact_info):
+        # Stream the edges straight in; no adjacency list is built
+        stream = GraphStream(physical_contact_info)
+        uf = UnionFind(stream.num_vertices)
+        for us, vs, _ in stream.batches():
+            uf.add_edge_arrays(us, vs)
+    else:
+        graph = physical_contact_info
+        uf = UnionFind(len(graph))
+        for u in range(len(graph)):
+            for v, _ in graph[u]:
+                uf.union(u, v)
+    return uf
+
+
+def _undirected_neighbours(physical_contact_info):
     """
-    Finds connected components (or "bubbles") in an undirected contact graph.
+    Neighbour lists with every edge in both directions, so DFS finds
+    components even when the graph (or its header) is directed.
     """
-    lines = physical_contact_info.splitlines()
-    first_line = lines[0].split()
+    if isinstance(physical_contact_info, CSRGraph) and not physical_contact_info.directed:
+        return physical_contact_info  # Already stores both directions
 
-    # Number of vertices in the graph
-    num_vertices = int(first_line[1])
+    if is_graph_source(physical_contact_info):
+        stream = GraphStream(physical_contact_info)
+        graph = [[] for _ in range(stream.num_vertices)]
+        for us, vs, _ in stream.batches():
+            for u, v in zip(us, vs):
+                graph[u].append((v, None))
+                graph[v].append((u, None))
+    else:
+        graph = [[] for _ in range(len(physical_contact_info))]
+        for u in range(len(physical_contact_info)):
+            for v, _ in physical_contact_info[u]:
+                graph[u].append((v, None))
+                graph[v].append((u, None))
+    return graph
 
-    # Initialize adjacency list for all vertices
-    graph = {i: [] for i in range(num_vertices)}
 
-    # Read edges and populate adjacency list
-    for line in lines[1:]:
-        parts = line.split()
-        u, v = int(parts[0]), int(parts[1])
+def component_labels(physical_contact_info):
+    """
+    Labels every vertex with its component number in a single pass over the
+    edges, using union–find. Returns an array of labels 0..k-1.
+    """
+    return _union_find(physical_contact_info).labels()
 
-        # Ensure both vertices exist in the graph
-        if u not in graph:
-            graph[u] = []
-        if v not in graph:
-            graph[v] = []
 
-        # Add undirected edge (both directions)
-        graph[u].append(v)
-        graph[v].append(u)
+def connected_components(physical_contact_info, backend="dfs"):
+    """
+    Finds connected components (or "bubbles") in an undirected contact graph.
 
-    visited = set()         # Track visited vertices
-    components = []         # Store connected components
+    Accepts either a graph description (string, file object or mmap) or an
+    already built undirected graph (an adjacency list or a CSRGraph).
+    backend="union_find" merges edges as they are read instead of building
+    an adjacency list and running DFS over it.
+    """
+    if backend == "union_find":
+        return _union_find(physical_contact_info).components()
+    if backend != "dfs":
+        raise ValueError(f"Unknown backend {backend!r}; expected 'dfs' or 'union_find'.")
 
-    def dfs(node, component):
-        """Recursive DFS to collect all vertices in the same component."""
-        visited.add(node)
-        component.add(node)
-        for neighbour in graph.get(node, []):
-            if neighbour not in visited:
-                dfs(neighbour, component)
+    graph = _undirected_neighbours(physical_contact_info)
+    visited = [False] * len(graph)  # Track visited vertices
+    components = []                 # Store connected components
 
     # For each vertex, run DFS if not already visited
-    for vertex in graph:
-        if vertex not in visited:
+    for vertex in range(len(graph)):
+        if not visited[vertex]:
             component = set()
-            dfs(vertex, component)
+            dfs_visit(graph, vertex, visited, pre=component.add)
             components.append(component)
 
     return components
@@ -56,3 +90,17 @@ U 1
     # Sort each component and then sort the list of components for consistent output
     print(sorted(sorted(component) for component in connected_components(physical_contact_info)))
     # Expected: [[0]]
+
+    # Same question answered with union–find
+    contacts = """\
+U 5
+0 1
+3 4
+"""
+    print(sorted(sorted(component) for component in connected_components(contacts, backend="union_find")))
+    # Expected: [[0, 1], [2], [3, 4]]
+    print(list(component_labels(contacts)))  # Expected: [0, 0, 1, 2, 2]
+
+    # Edges of a directed graph still join components, whichever backend
+    print(connected_components("D 3\n1 0\n"), connected_components("D 3\n1 0\n", backend="union_find"))
+    # Expected: [{0, 1}, {2}] [{0, 1}, {2}]
@@ -1,5 +1,47 @@
 from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
 
+
+def dfs_visit(adj_list, start, visited, pre=None, post=None, parent=None):
+    """
+    Iterative depth-first traversal from start, using an explicit stack.
+
+    Explores every vertex reachable from start that is not yet marked in
+    visited (which is updated in place, so it can be shared between calls).
+    Optional hooks: pre(v) runs when v is discovered and post(v) when all of
+    its neighbours are finished; parent, if given, is filled with the DFS
+    tree parent of each newly discovered vertex.
+
+    Visits vertices in the same order as the recursive version, but with no
+    recursion limit.
+    """
+    visited[start] = True
+    if pre is not None:
+        pre(start)
+
+    # The stack is kept as two parallel lists: the vertices on the current
+    # path and, for each, its own neighbour iterator, so when we come back to
+    # a vertex we resume where we left off rather than rescanning.
+    vertices = [start]
+    iterators = [iter(adj_list[start])]
+    while iterators:
+        for neighbour, _ in iterators[-1]:
+            if not visited[neighbour]:
+                visited[neighbour] = True
+                if parent is not None:
+                    parent[neighbour] = vertices[-1]  # Record parent when discovering a new vertex
+                if pre is not None:
+                    pre(neighbour)
+                vertices.append(neighbour)
+                iterators.append(iter(adj_list[neighbour]))
+                break  # Descend into the neighbour before looking at the rest
+        else:
+            # All neighbours done: the vertex on top of the stack is finished
+            iterators.pop()
+            v = vertices.pop()
+            if post is not None:
+                post(v)
+
+
 def dfs_tree(adj_list, start):
     """
     Builds a DFS (Depth-First Search) tree from a given adjacency list.
@@ -7,16 +49,7 @@ def dfs_tree(adj_list, start):
     parent = [None] * len(adj_list)   # Will store DFS tree parents
     visited = [False] * len(adj_list) # Track visited vertices
 
-    def dfs(v):
-        """Recursive DFS that explores as deep as possible before backtracking."""
-        visited[v] = True
-        # Explore each neighbor of the current vertex
-        for neighbor, weight in adj_list[v]:
-            if not visited[neighbor]:
-                parent[neighbor] = v  # Record parent when discovering a new vertex
-                dfs(neighbor)         # Recurse into neighbor
-
-    dfs(start)  # Start DFS from the given starting vertex
+    dfs_visit(adj_list, start, visited, parent=parent)  # Start DFS from the given starting vertex
     return parent
 
 
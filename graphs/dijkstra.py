@@ -1,34 +1,75 @@
+import heapq
 from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from sorting.heapsort import IndexedHeap
 
 
-def dijkstra(adj_list, start):
+def _dijkstra_lazy(adj_list, start, target, distance, parent):
+    """Binary heap (heapq) with lazy deletion of stale entries."""
+    settled = [False] * len(adj_list)
+    pq = [(0, start)]
+    while pq:
+        current_dist, u = heapq.heappop(pq)
+
+        # Skip stale entries left behind by later improvements
+        if settled[u]:
+            continue
+        settled[u] = True
+        if u == target:
+            break  # Target's distance is final, nothing more to do
+
+        # Relax edges from u to its neighbours
+        for v, weight in adj_list[u]:
+            new_dist = current_dist + weight
+            if new_dist < distance[v]:
+                distance[v] = new_dist
+                parent[v] = u
+                heapq.heappush(pq, (new_dist, v))
+
+
+def _dijkstra_indexed(adj_list, start, target, distance, parent, arity):
+    """Indexed d-ary heap with decrease-key (one heap entry per vertex)."""
+    settled = [False] * len(adj_list)
+    pq = IndexedHeap(len(adj_list), arity)
+    pq.push_or_decrease(start, 0)
+    while pq:
+        current_dist, u = pq.pop()
+        settled[u] = True
+        if u == target:
+            break
+
+        for v, weight in adj_list[u]:
+            new_dist = current_dist + weight
+            if new_dist < distance[v] and not settled[v]:
+                distance[v] = new_dist
+                parent[v] = u
+                pq.push_or_decrease(v, new_dist)
+
+
+def dijkstra(adj_list, start, target=None, strategy="lazy", arity=4):
     """
     Computes shortest paths from a starting vertex using Dijkstra's algorithm.
+
+    Notes
+    -----
+    - strategy="lazy" uses heapq and skips outdated entries when popped;
+      strategy="indexed" uses a d-ary heap (arity children per node) with
+      decrease-key, so the heap never holds more than V entries.
+    - If target is given the search stops once the target is settled. Its
+      distance (and the path to it via parent) is then final, but other
+      vertices may only have tentative values.
+    - Time complexity is O((V + E) log V) for both strategies.
     """
     # Initialize distances (∞ for all except start) and parents
     distance = [float('inf')] * len(adj_list)
     parent = [None] * len(adj_list)
     distance[start] = 0
 
-    # Priority queue (as a list for simplicity) storing (distance, vertex)
-    pq = [(0, start)]
-
-    # Main loop: process vertices in order of increasing distance
-    while pq:
-        # Get vertex with smallest known distance
-        current_dist, u = min(pq)
-        pq.remove((current_dist, u))
-
-        # Skip if this distance is outdated
-        if current_dist > distance[u]:
-            continue
-
-        # Relax edges from u to its neighbors
-        for v, weight in adj_list[u]:
-            if distance[v] > distance[u] + weight:
-                distance[v] = distance[u] + weight
-                parent[v] = u
-                pq.append((distance[v], v))
+    if strategy == "lazy":
+        _dijkstra_lazy(adj_list, start, target, distance, parent)
+    elif strategy == "indexed":
+        _dijkstra_indexed(adj_list, start, target, distance, parent, arity)
+    else:
+        raise ValueError(f"Unknown strategy {strategy!r}; expected 'lazy' or 'indexed'.")
 
     return parent, distance
 
@@ -45,3 +86,5 @@ D 3 W
     adj_list = adjacency_list(graph_string)
     print(dijkstra(adj_list, 1))  # Expected: shortest paths from vertex 1
     print(dijkstra(adj_list, 2))  # Expected: shortest paths from vertex 2
+    print(dijkstra(adj_list, 1, strategy="indexed"))  # Same as the first call
+    print(dijkstra(adj_list, 1, target=2))  # Stops once vertex 2 is settled
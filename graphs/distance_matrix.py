@@ -1,36 +1,31 @@
-def adjacency_list(graph_str):
-    """Convert a graph string into an adjacency list.
-    """
-    # Split the graph string into lines and process the header
-    lines = graph_str.splitlines()
-    first_line = lines[0].split()
-
-    # Determine if the graph is directed
-    directed = first_line[0] == "D"
+from data_structures.graph_parser import GraphStream
 
-    # Determine if the graph is weighted
-    weighted = len(first_line) > 2 and first_line[2] == "W"
 
-    # Number of vertices
-    num_vertices = int(first_line[1])
+def adjacency_list(graph_str):
+    """Convert a graph string (or file object / mmap) into an adjacency list.
+    """
+    # Parse the header; edges are streamed in batches below
+    stream = GraphStream(graph_str)
+    directed = stream.directed
+    weighted = stream.weighted
 
     # Initialise an empty adjacency list for each vertex
-    outer_list = [[] for _ in range(num_vertices)]
+    outer_list = [[] for _ in range(stream.num_vertices)]
 
-    # Process each edge
-    for line in lines[1:]:
-        parts = line.split()
-        u, v = int(parts[0]), int(parts[1])
+    # Process each batch of edges
+    for us, vs, ws in stream.batches():
+        for i in range(len(us)):
+            u, v = us[i], vs[i]
 
-        # If weighted, parse the weight; otherwise default to None
-        weight = int(parts[2]) if weighted else None
+            # If weighted, use the parsed weight; otherwise default to None
+            weight = ws[i] if weighted else None
 
-        # Add edge u -> v
-        outer_list[u].append((v, weight))
+            # Add edge u -> v
+            outer_list[u].append((v, weight))
 
-        # If undirected, also add v -> u
-        if not directed:
-            outer_list[v].append((u, weight))
+            # If undirected, also add v -> u
+            if not directed:
+                outer_list[v].append((u, weight))
 
     return outer_list
 
@@ -56,10 +51,11 @@ def initial_distance_matrix(adj_list):
 
 
 # Example usage
-graph_str = """\
+if __name__ == "__main__":
+    graph_str = """\
 D 2 W
 0 1 4
 """
 
-adj_list = adjacency_list(graph_str)
-print(initial_distance_matrix(adj_list))
+    adj_list = adjacency_list(graph_str)
+    print(initial_distance_matrix(adj_list))
@@ -0,0 +1,265 @@
+import heapq
+from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from data_structures.csr_graph import CSRGraph, csr_graph
+from data_structures.graph_parser import is_graph_source
+from graphs.dijkstra import dijkstra
+from graphs.floyd_warshall import floyd, initial_distance_matrix
+
+INFINITY = float('inf')
+
+
+class DynamicGraph:
+    """
+    Mutable weighted graph that keeps shortest paths up to date as it changes.
+
+    Built from a graph description, a CSRGraph, an adjacency_list() result
+    or a vertex count. A description's U/D header or a CSRGraph's directed
+    flag says whether the graph is directed; for an adjacency list or a
+    vertex count directed must be given. Edges can be added, removed and reweighted; each change bumps self.version (as used
+    by ShortestPathCache) and repairs any tracked results instead of
+    recomputing them:
+
+    - track_source(s) keeps a single-source tree (parent, distance) from s.
+      Decreases are propagated Dijkstra-style from the improved vertex;
+      increases only recompute the subtree that hung off the changed edge
+      (Ramalingam–Reps). Needs non-negative weights.
+    - track_all_pairs() keeps a Floyd–Warshall distance matrix. A decrease
+      costs O(n^2); an increase re-runs Dijkstra only from the sources
+      whose shortest paths might have used the edge.
+
+    Indexing works like an adjacency list (graph[u] yields (v, weight)
+    pairs), so dijkstra(), bfs_tree() and friends accept a DynamicGraph.
+    At most one edge is kept between an ordered pair of vertices: of
+    parallel edges in the input the cheapest is used, and unweighted edges
+    weigh 1.
+    """
+    def __init__(self, adj_list, directed=None):
+        if is_graph_source(adj_list):
+            adj_list = csr_graph(adj_list)
+        if isinstance(adj_list, CSRGraph):
+            if directed is not None and directed != adj_list.directed:
+                raise ValueError("directed does not match the CSRGraph's directed flag.")
+            directed = adj_list.directed
+        elif directed is None:
+            raise ValueError("Pass directed=True or False when building from an adjacency list or vertex count.")
+        if isinstance(adj_list, int):
+            adj_list = [[] for _ in range(adj_list)]
+        n = len(adj_list)
+        self.directed = directed
+        self.version = 0
+        self._out = [{} for _ in range(n)]   # _out[u][v] = weight of u -> v
+        self._in = [{} for _ in range(n)]    # _in[v][u] = weight of u -> v
+        for u in range(n):
+            out_u = self._out[u]
+            for v, weight in adj_list[u]:
+                weight = 1 if weight is None else weight
+                if v not in out_u or weight < out_u[v]:
+                    self._set(u, v, weight)
+        self._negative = sum(w < 0 for edges in self._out for w in edges.values())
+        self._trees = {}          # source -> (parent, distance)
+        self._all_pairs = None    # Distance matrix, if tracked
+
+    def __len__(self):
+        return len(self._out)
+
+    def __getitem__(self, u):
+        return self._out[u].items()
+
+    def weight(self, u, v):
+        """Weight of edge u -> v, or None if there is no such edge."""
+        return self._out[u].get(v)
+
+    def _set(self, u, v, weight):
+        if weight is None:
+            del self._out[u][v]
+            del self._in[v][u]
+        else:
+            self._out[u][v] = weight
+            self._in[v][u] = weight
+
+    # ---------- Mutations ----------
+
+    def add_edge(self, u, v, weight):
+        """Add edge u -> v (and v -> u if undirected)."""
+        if v in self._out[u]:
+            raise ValueError(f"Edge {u} -> {v} already exists; use update_weight().")
+        self._change(u, v, weight)
+
+    def remove_edge(self, u, v):
+        """Remove edge u -> v (and v -> u if undirected)."""
+        if v not in self._out[u]:
+            raise ValueError(f"No edge {u} -> {v}.")
+        self._change(u, v, None)
+
+    def update_weight(self, u, v, weight):
+        """Change the weight of the existing edge u -> v."""
+        if v not in self._out[u]:
+            raise ValueError(f"No edge {u} -> {v}.")
+        self._change(u, v, weight)
+
+    def _change(self, u, v, weight):
+        self._apply(u, v, weight)
+        if not self.directed and u != v:
+            self._apply(v, u, weight)
+        self.version += 1
+
+    def _apply(self, u, v, new):
+        """Change one directed edge and repair everything being tracked."""
+        old = self._out[u].get(v)
+        if new is not None and new < 0 and self._trees:
+            raise ValueError("Negative weights are not supported while tracking sources.")
+        self._negative += (new is not None and new < 0) - (old is not None and old < 0)
+        self._set(u, v, new)
+
+        old_cost = INFINITY if old is None else old
+        new_cost = INFINITY if new is None else new
+        if new_cost < old_cost:
+            for tree in self._trees.values():
+                self._tree_decrease(tree, u, v, new_cost)
+            if self._all_pairs is not None:
+                self._matrix_decrease(u, v, new_cost)
+        elif new_cost > old_cost:
+            for tree in self._trees.values():
+                self._tree_increase(tree, u, v)
+            if self._all_pairs is not None:
+                self._matrix_increase(u, v, old_cost)
+
+    # ---------- Single-source trees ----------
+
+    def track_source(self, source):
+        """Start maintaining shortest paths from source; returns (parent, distance)."""
+        if self._negative:
+            raise ValueError("Single-source tracking needs non-negative weights.")
+        if source not in self._trees:
+            self._trees[source] = dijkstra(self, source)
+        return self._trees[source]
+
+    def untrack_source(self, source):
+        self._trees.pop(source, None)
+
+    def shortest_paths(self, source):
+        """Current (parent, distance) lists for a tracked source."""
+        return self._trees[source]
+
+    def _propagate(self, heap, parent, distance, allowed=None):
+        """Dijkstra from the vertices already in heap, optionally limited to a set."""
+        while heap:
+            d_x, x = heapq.heappop(heap)
+            if d_x > distance[x]:
+                continue  # Outdated entry
+            for y, weight in self._out[x].items():
+                if allowed is not None and y not in allowed:
+                    continue
+                if d_x + weight < distance[y]:
+                    distance[y] = d_x + weight
+                    parent[y] = x
+                    heapq.heappush(heap, (distance[y], y))
+
+    def _tree_decrease(self, tree, u, v, weight):
+        parent, distance = tree
+        if distance[u] + weight < distance[v]:
+            distance[v] = distance[u] + weight
+            parent[v] = u
+            self._propagate([(distance[v], v)], parent, distance)
+
+    def _tree_increase(self, tree, u, v):
+        parent, distance = tree
+        if parent[v] != u:
+            return  # Edge wasn't in the tree, so no distance depends on it
+
+        # Everything in v's subtree may now be further away
+        affected = {v}
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            for y in self._out[x]:
+                if parent[y] == x and y not in affected:
+                    affected.add(y)
+                    stack.append(y)
+
+        # Best way into each affected vertex from the unaffected part...
+        heap = []
+        for x in affected:
+            distance[x] = INFINITY
+            parent[x] = None
+        for x in affected:
+            for y, weight in self._in[x].items():
+                if y not in affected and distance[y] + weight < distance[x]:
+                    distance[x] = distance[y] + weight
+                    parent[x] = y
+            if distance[x] != INFINITY:
+                heap.append((distance[x], x))
+        heapq.heapify(heap)
+
+        # ...then settle the affected vertices among themselves
+        self._propagate(heap, parent, distance, allowed=affected)
+
+    # ---------- All pairs ----------
+
+    def track_all_pairs(self):
+        """Start maintaining the all-pairs distance matrix; returns it."""
+        if self._all_pairs is None:
+            self._all_pairs = floyd(initial_distance_matrix(self))
+        return self._all_pairs
+
+    def all_pairs(self):
+        """Current all-pairs distance matrix (must be tracked)."""
+        return self._all_pairs
+
+    def _matrix_decrease(self, u, v, weight):
+        D = self._all_pairs
+        row_v = D[v]
+        # Any path can now be i -> ... -> u -> v -> ... -> j
+        for row_i in D:
+            via = row_i[u] + weight
+            if via >= row_i[v]:
+                continue  # Nothing from i improves through the new edge
+            for j, d_vj in enumerate(row_v):
+                if via + d_vj < row_i[j]:
+                    row_i[j] = via + d_vj
+
+    def _matrix_increase(self, u, v, old_weight):
+        D = self._all_pairs
+        n = len(D)
+        # Only sources whose shortest path to v went over this edge can change
+        affected = [i for i in range(n) if D[i][u] + old_weight == D[i][v] != INFINITY]
+        if not affected:
+            return
+        if self._negative:
+            # Update in place so the matrix handed out by track_all_pairs() stays live
+            D[:] = floyd(initial_distance_matrix(self))
+            return
+        for i in affected:
+            D[i] = dijkstra(self, i)[1]
+
+
+# --- Test ---
+if __name__ == "__main__":
+    graph_string = """\
+D 4 W
+0 1 1
+1 2 1
+0 2 5
+2 3 1
+"""
+    graph = DynamicGraph(graph_string)
+    print(graph.track_source(0)[1])   # Expected: [0, 1, 2, 3]
+    graph.update_weight(1, 2, 10)
+    print(graph.shortest_paths(0)[1])  # Expected: [0, 1, 5, 6]
+    graph.track_all_pairs()
+    graph.add_edge(0, 3, 2)
+    print(graph.all_pairs()[0])        # Expected: [0, 1, 5, 2]
+    print(graph.version)               # Expected: 2
+
+    # With a negative weight the matrix is rebuilt, but in the same list
+    graph = DynamicGraph([[(1, 1)], [(2, -1)], []], directed=True)
+    matrix = graph.track_all_pairs()
+    graph.update_weight(0, 1, 5)
+    print(matrix[0], matrix is graph.all_pairs())   # Expected: [0, 5, 4] True
+
+    # Parallel edges keep the cheapest; an undirected header keeps both directions in step
+    graph = DynamicGraph(adjacency_list("D 2 W\n0 1 3\n0 1 5\n"), directed=True)
+    print(graph.track_source(0)[1])   # Expected: [0, 3]
+    graph = DynamicGraph("U 2 W\n0 1 3\n")
+    graph.update_weight(0, 1, 4)
+    print(graph.weight(1, 0))          # Expected: 4
@@ -1,4 +1,13 @@
 from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from data_structures.csr_graph import CSRGraph
+
+HAS_NUMPY = True
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+
+INFINITY = float('inf')
 
 
 def initial_distance_matrix(adj_list):
@@ -13,33 +22,198 @@ def initial_distance_matrix(adj_list):
     for j in range(num_ver):
         matrix[j][j] = 0
 
-    # Fill matrix with edge weights from adjacency list
+    # Fill matrix with edge weights from adjacency list, keeping the
+    # cheapest of parallel edges (a self-loop only counts if negative)
     for i in range(num_ver):
+        row = matrix[i]
         for v, weight in adj_list[i]:
-            matrix[i][v] = weight
+            if weight < row[v]:
+                row[v] = weight
 
     return matrix
 
 
-def floyd(distance):
+def floyd(distance, method="python", block_size=64):
     """
     Floyd–Warshall algorithm for all-pairs shortest paths.
+
+    Accepts a distance matrix, or a CSRGraph which is first converted with
+    initial_distance_matrix(). Always returns a new list-of-lists matrix.
+
+    Notes
+    -----
+    - method="python" is the plain triple loop.
+    - method="numpy" does each k-iteration as one vectorised array operation
+      (see floyd_numpy); method="blocked" uses the cache-tiled version (see
+      floyd_blocked). Both need NumPy.
+    - Time complexity is O(n^3) for every method.
     """
+    if isinstance(distance, CSRGraph):
+        distance = initial_distance_matrix(distance)
+
+    if method == "numpy":
+        return floyd_numpy(distance).tolist()
+    if method == "blocked":
+        return floyd_blocked(distance, block_size).tolist()
+    if method != "python":
+        raise ValueError(f"Unknown method {method!r}; expected 'python', 'numpy' or 'blocked'.")
+
     # Make a deep copy so original distance matrix remains unchanged
     new_distance = [row.copy() for row in distance]
     n = len(new_distance)
 
     # Triple nested loop: try each vertex as an intermediate point
     for k in range(n):
+        row_k = new_distance[k]
         for i in range(n):
+            row_i = new_distance[i]
+            d_ik = row_i[k]
+            if d_ik == INFINITY:
+                continue  # No path i -> k, so k can't shorten anything from i
             for j in range(n):
                 # If a shorter path is found via k, update the distance
-                if new_distance[i][j] > new_distance[i][k] + new_distance[k][j]:
-                    new_distance[i][j] = new_distance[i][k] + new_distance[k][j]
+                if row_i[j] > d_ik + row_k[j]:
+                    row_i[j] = d_ik + row_k[j]
 
     return new_distance
 
 
+def _require_numpy():
+    if not HAS_NUMPY:
+        raise ModuleNotFoundError("numpy is required for this Floyd–Warshall variant.")
+
+
+def floyd_numpy(distance):
+    """
+    Vectorised Floyd–Warshall returning a new float64 NumPy array.
+
+    Each k-iteration relaxes the whole matrix at once with
+    D = min(D, D[:, k] + D[k, :]).
+    """
+    _require_numpy()
+    D = np.array(distance, dtype=np.float64)
+    n = D.shape[0]
+    for k in range(n):
+        np.minimum(D, D[:, k, None] + D[None, k, :], out=D)
+    return D
+
+
+def floyd_blocked(distance, block_size=64):
+    """
+    Cache-blocked (tiled) Floyd–Warshall returning a new float64 NumPy array.
+
+    The matrix is processed in block_size x block_size tiles. For each
+    diagonal tile: (1) run Floyd–Warshall inside it, (2) update the row and
+    column panels through it, (3) update every other tile with a min-plus
+    product of its row and column panel tiles. Each step only touches a few
+    tiles at a time, so it stays in cache for matrices that don't.
+    """
+    _require_numpy()
+    D = np.array(distance, dtype=np.float64)
+    n = D.shape[0]
+    starts = range(0, n, block_size)
+
+    for kb_start in starts:
+        kb = slice(kb_start, min(kb_start + block_size, n))
+        diag = D[kb, kb]
+        b = diag.shape[0]
+
+        # Phase 1: the diagonal tile on its own
+        for k in range(b):
+            np.minimum(diag, diag[:, k, None] + diag[None, k, :], out=diag)
+
+        # Phase 2: row panel D[kb, :] and column panel D[:, kb]
+        row_panel = D[kb, :]
+        col_panel = D[:, kb]
+        for k in range(b):
+            np.minimum(row_panel, diag[:, k, None] + row_panel[None, k, :], out=row_panel)
+            np.minimum(col_panel, col_panel[:, k, None] + diag[None, k, :], out=col_panel)
+
+        # Phase 3: every remaining tile via the (now final) panels
+        for i_start in starts:
+            if i_start == kb_start:
+                continue
+            rows = slice(i_start, min(i_start + block_size, n))
+            left = D[rows, kb]
+            for j_start in starts:
+                if j_start == kb_start:
+                    continue
+                cols = slice(j_start, min(j_start + block_size, n))
+                tile = D[rows, cols]
+                via_kb = (left[:, :, None] + D[kb, cols][None, :, :]).min(axis=1)
+                np.minimum(tile, via_kb, out=tile)
+
+    return D
+
+
+def floyd_with_predecessors(distance):
+    """
+    Floyd–Warshall that also returns a predecessor matrix.
+
+    pred[i][j] is the vertex before j on a shortest path from i to j, or None
+    if there is no such path (or i == j). Use reconstruct_path() to follow it.
+    Uses NumPy when available, in which case distances come back as floats.
+    """
+    if isinstance(distance, CSRGraph):
+        distance = initial_distance_matrix(distance)
+    n = len(distance)
+
+    if HAS_NUMPY:
+        D = np.array(distance, dtype=np.float64)
+        P = np.where(np.isfinite(D), np.arange(n)[:, None], -1)
+        np.fill_diagonal(P, -1)
+        for k in range(n):
+            via_k = D[:, k, None] + D[None, k, :]
+            shorter = via_k < D
+            D = np.where(shorter, via_k, D)
+            P = np.where(shorter, P[None, k, :], P)
+        pred = [[None if p < 0 else p for p in row] for row in P.tolist()]
+        return D.tolist(), pred
+
+    new_distance = [row.copy() for row in distance]
+    pred = [[i if new_distance[i][j] != INFINITY and i != j else None for j in range(n)]
+            for i in range(n)]
+    for k in range(n):
+        row_k, pred_k = new_distance[k], pred[k]
+        for i in range(n):
+            row_i, pred_i = new_distance[i], pred[i]
+            d_ik = row_i[k]
+            if d_ik == INFINITY:
+                continue
+            for j in range(n):
+                if row_i[j] > d_ik + row_k[j]:
+                    row_i[j] = d_ik + row_k[j]
+                    pred_i[j] = pred_k[j]  # Last hop into j is now k's last hop
+    return new_distance, pred
+
+
+def has_negative_cycle(distance):
+    """
+    True if a Floyd–Warshall result contains a negative cycle, i.e. some
+    vertex has a negative shortest distance to itself.
+    """
+    return any(distance[i][i] < 0 for i in range(len(distance)))
+
+
+def reconstruct_path(pred, i, j):
+    """
+    Return the list of vertices on a shortest path from i to j, using the
+    predecessor matrix from floyd_with_predecessors(), or None if j is
+    unreachable from i.
+    """
+    if i == j:
+        return [i]
+    if pred[i][j] is None:
+        return None
+    path = [j]
+    while j != i:
+        j = pred[i][j]
+        path.append(j)
+        if len(path) > len(pred):
+            raise ValueError("Path runs through a negative cycle.")
+    return path[::-1]
+
+
 # --- Test ---
 if __name__ == "__main__":
     # Directed weighted graph with 3 vertices
@@ -66,3 +240,8 @@ D 3 W
 
     print("Final distance matrix (should be unchanged):")
     print(matrix)  # matrix stays the same because floyd() returns a copy
+
+    # Same result with a predecessor matrix, then rebuild the path 0 -> 2
+    distances, pred = floyd_with_predecessors(matrix)
+    print("Path 0 -> 2:", reconstruct_path(pred, 0, 2))  # Expected: [0, 1, 2]
+    print("Negative cycle:", has_negative_cycle(distances))  # Expected: False
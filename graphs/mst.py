@@ -0,0 +1,151 @@
+import heapq
+import math
+from array import array
+
+from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from data_structures.csr_graph import CSRGraph, weight_typecode
+from data_structures.union_find import UnionFind
+
+HAS_NUMPY = True
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+
+
+def _edge_arrays(graph):
+    """
+    Flat (us, vs, ws) arrays with each undirected edge listed once (u < v).
+    Self-loops are dropped since they can never be in a spanning tree.
+    Weights are int64 if every weight is an int and float64 otherwise.
+    """
+    us, vs, ws = array('i'), array('i'), []
+    if isinstance(graph, CSRGraph):
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        for u in range(len(graph)):
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if u < v:
+                    us.append(u)
+                    vs.append(v)
+                    ws.append(weights[i])
+    else:
+        for u in range(len(graph)):
+            for v, weight in graph[u]:
+                if u < v:
+                    us.append(u)
+                    vs.append(v)
+                    ws.append(weight)
+    return us, vs, array(weight_typecode(ws), ws)
+
+
+def kruskal(graph):
+    """
+    Minimum spanning tree (forest, if disconnected) by Kruskal's algorithm.
+
+    Takes an undirected weighted adjacency list or CSRGraph and returns
+    (total_weight, edges) with edges as (u, v, weight) tuples.
+
+    Notes
+    -----
+    - Edges are kept in flat arrays and sorted once by weight (with
+      numpy.argsort when available), then added cheapest first unless
+      union–find says they would close a cycle.
+    - Time complexity is O(E log E).
+    """
+    n = len(graph)
+    us, vs, ws = _edge_arrays(graph)
+    if HAS_NUMPY:
+        dtype = np.int64 if ws.typecode == 'q' else np.float64
+        order = np.argsort(np.frombuffer(ws, dtype=dtype), kind="stable").tolist()
+    else:
+        order = sorted(range(len(ws)), key=ws.__getitem__)
+
+    components = UnionFind(n)
+    union = components.union
+    total = 0
+    edges = []
+    for i in order:
+        if union(us[i], vs[i]):
+            total += ws[i]
+            edges.append((us[i], vs[i], ws[i]))
+            if len(edges) == n - 1:
+                break  # Tree is complete
+    return total, edges
+
+
+def prim(graph):
+    """
+    Minimum spanning tree (forest, if disconnected) by Prim's algorithm.
+
+    Takes an undirected weighted adjacency list or CSRGraph and returns
+    (total_weight, edges) with edges as (u, v, weight) tuples.
+
+    Notes
+    -----
+    - Grows the tree from one vertex, always adding the cheapest edge that
+      leaves it, using heapq with lazy deletion of stale entries.
+    - Time complexity is O(E log V).
+    """
+    n = len(graph)
+    in_tree = bytearray(n)
+    total = 0
+    edges = []
+    for root in range(n):
+        if in_tree[root]:
+            continue
+        in_tree[root] = 1
+        pq = [(weight, root, v) for v, weight in graph[root]]
+        heapq.heapify(pq)
+        while pq:
+            weight, u, v = heapq.heappop(pq)
+            if in_tree[v]:
+                continue  # Both ends already in the tree
+            in_tree[v] = 1
+            total += weight
+            edges.append((u, v, weight))
+            for w, edge_weight in graph[v]:
+                if not in_tree[w]:
+                    heapq.heappush(pq, (edge_weight, v, w))
+    return total, edges
+
+
+def minimum_spanning_tree(graph, method="auto"):
+    """
+    Minimum spanning tree of an undirected weighted graph.
+
+    method="auto" uses Prim for dense graphs (average degree above log2 V),
+    where its O(E log V) heap work beats sorting every edge, and Kruskal
+    otherwise. Returns (total_weight, edges) as kruskal() and prim() do.
+    """
+    if method == "auto":
+        n = len(graph)
+        if isinstance(graph, CSRGraph):
+            num_edges = graph.num_edges
+        else:
+            num_edges = sum(len(edges) for edges in graph)
+        method = "prim" if n and num_edges / n > math.log2(n + 1) else "kruskal"
+    if method == "kruskal":
+        return kruskal(graph)
+    if method == "prim":
+        return prim(graph)
+    raise ValueError(f"Unknown method {method!r}; expected 'auto', 'kruskal' or 'prim'.")
+
+
+# --- Test ---
+if __name__ == "__main__":
+    graph_string = """\
+U 4 W
+0 1 1
+1 2 2
+2 3 1
+0 3 5
+0 2 3
+"""
+    adj_list = adjacency_list(graph_string)
+    print(kruskal(adj_list))  # Expected: (4, [(0, 1, 1), (2, 3, 1), (1, 2, 2)])
+    print(prim(adj_list))     # Expected: (4, [(0, 1, 1), (1, 2, 2), (2, 3, 1)])
+    # Float weights give the same tree whichever method "auto" picks
+    floats = [[(1, 0.5), (2, 1.5)], [(0, 0.5), (2, 0.25)], [(0, 1.5), (1, 0.25)]]
+    print(kruskal(floats))    # Expected: (0.75, [(1, 2, 0.25), (0, 1, 0.5)])
+    print(prim(floats))       # Expected: (0.75, [(0, 1, 0.5), (1, 2, 0.25)])
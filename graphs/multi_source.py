@@ -0,0 +1,159 @@
+import heapq
+from array import array
+from collections import deque
+
+from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+
+INFINITY = float('inf')
+
+
+class SearchWorkspace:
+    """
+    Work arrays reused across many searches on graphs of one size.
+
+    Instead of clearing distance/visited arrays before every search, each
+    search gets a new stamp number: an entry only counts as set if its
+    stamp matches the current search, so starting a search is O(1).
+    """
+    def __init__(self, num_vertices):
+        self.distance = [INFINITY] * num_vertices
+        self.reached = array('i', [0]) * num_vertices   # Stamp when distance was set
+        self.settled = array('i', [0]) * num_vertices   # Stamp when vertex was settled
+        self.stamp = 0
+
+    def begin(self):
+        """Start a new search; everything from earlier searches is ignored."""
+        self.stamp += 1
+        return self.stamp
+
+
+def multi_source_dijkstra(adj_list, sources):
+    """
+    Dijkstra from many sources at once: one search in which every source
+    starts at distance 0.
+
+    Returns (nearest, distance, parent): nearest[v] is the source closest to
+    v (None if none can reach it), distance[v] its distance, and parent[v]
+    the previous vertex on that path. Time complexity is O((V + E) log V)
+    however many sources there are.
+    """
+    n = len(adj_list)
+    distance = [INFINITY] * n
+    parent = [None] * n
+    nearest = [None] * n
+    settled = bytearray(n)
+
+    pq = []
+    for s in sources:
+        distance[s] = 0
+        nearest[s] = s
+        pq.append((0, s))
+    heapq.heapify(pq)
+
+    while pq:
+        d_u, u = heapq.heappop(pq)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        for v, weight in adj_list[u]:
+            new_dist = d_u + weight
+            if new_dist < distance[v]:
+                distance[v] = new_dist
+                parent[v] = u
+                nearest[v] = nearest[u]  # Inherit the label of u's source
+                heapq.heappush(pq, (new_dist, v))
+    return nearest, distance, parent
+
+
+def multi_source_bfs(adj_list, sources):
+    """
+    Breadth-first search from many sources at once (unweighted distances).
+
+    Returns (nearest, distance) as in multi_source_dijkstra, with -1 as the
+    distance of unreachable vertices.
+    """
+    n = len(adj_list)
+    distance = array('i', [-1]) * n
+    nearest = [None] * n
+    queue = deque()
+    for s in sources:
+        if distance[s] == -1:
+            distance[s] = 0
+            nearest[s] = s
+            queue.append(s)
+
+    while queue:
+        u = queue.popleft()
+        next_dist = distance[u] + 1
+        for v, _ in adj_list[u]:
+            if distance[v] == -1:
+                distance[v] = next_dist
+                nearest[v] = nearest[u]
+                queue.append(v)
+    return nearest, distance
+
+
+def _nearest_from(adj_list, source, is_target, k, workspace):
+    """Dijkstra from source that stops once k targets have been settled."""
+    stamp = workspace.begin()
+    distance, reached, settled = workspace.distance, workspace.reached, workspace.settled
+    distance[source] = 0
+    reached[source] = stamp
+
+    found = []
+    pq = [(0, source)]
+    while pq:
+        d_u, u = heapq.heappop(pq)
+        if settled[u] == stamp:
+            continue
+        settled[u] = stamp
+        if is_target[u]:
+            found.append((u, d_u))
+            if len(found) == k:
+                break  # Anything still queued is at least as far away
+        for v, weight in adj_list[u]:
+            new_dist = d_u + weight
+            if reached[v] != stamp or new_dist < distance[v]:
+                distance[v] = new_dist
+                reached[v] = stamp
+                heapq.heappush(pq, (new_dist, v))
+    return found
+
+
+def k_nearest_targets(adj_list, sources, targets, k, workspace=None):
+    """
+    For each source, finds its k nearest targets.
+
+    Returns a list with one entry per source: a list of up to k
+    (target, distance) pairs in order of increasing distance. Each search
+    stops as soon as its k-th target is settled, and all searches share one
+    SearchWorkspace (pass your own to reuse it across calls), so there is no
+    per-source array allocation.
+    """
+    if k <= 0:
+        return [[] for _ in sources]
+    n = len(adj_list)
+    if workspace is None:
+        workspace = SearchWorkspace(n)
+    is_target = bytearray(n)
+    for t in targets:
+        is_target[t] = 1
+    return [_nearest_from(adj_list, s, is_target, k, workspace) for s in sources]
+
+
+# --- Test ---
+if __name__ == "__main__":
+    graph_string = """\
+U 5 W
+0 1 1
+1 2 1
+2 3 1
+3 4 1
+"""
+    adj_list = adjacency_list(graph_string)
+    nearest, distance, _ = multi_source_dijkstra(adj_list, [0, 4])
+    print(nearest, distance)   # Expected: [0, 0, 0, 4, 4] [0, 1, 2, 1, 0]
+    print(multi_source_bfs(adj_list, [2])[1].tolist())   # Expected: [2, 1, 0, 1, 2]
+    print(k_nearest_targets(adj_list, [0, 3], [1, 2, 4], 2))
+    # Expected: [[(1, 1), (2, 2)], [(2, 1), (4, 1)]]
+    print(k_nearest_targets(adj_list, [0], [0, 1], 0))   # Expected: [[]]
@@ -0,0 +1,207 @@
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from data_structures.csr_graph import CSRGraph, attach_csr, csr_from_adjacency_list, csr_graph, share_csr
+from data_structures.graph_parser import is_graph_source
+from graphs.bfs import bfs_levels
+from graphs.connected_components import component_labels
+
+
+def partition(graph, parts):
+    """
+    Split the vertices of a CSRGraph into contiguous (lo, hi) shards with
+    roughly equal numbers of vertices plus edges, so each shard is about
+    the same amount of work.
+    """
+    n = len(graph)
+    offsets = graph.offsets
+    total = n + graph.num_edges
+    cost = lambda v: offsets[v] + v   # Work in vertices [0, v); increasing in v
+    bounds = [0]
+    for i in range(1, parts):
+        bounds.append(max(bounds[-1], bisect_left(range(n + 1), total * i // parts, key=cost)))
+    bounds.append(n)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+
+# Per-process state, set up once in each worker by _init_worker
+_worker = {}
+
+
+def _init_worker(graph_spec, reverse_spec, state_name):
+    """Attach to the shared graph(s) and the shared state array."""
+    blocks, graph = attach_csr(graph_spec)
+    reverse = None
+    if reverse_spec is not None:
+        reverse_blocks, reverse = attach_csr(reverse_spec)
+        blocks += reverse_blocks
+    state = shared_memory.SharedMemory(name=state_name)
+    _worker.update(blocks=blocks + [state], graph=graph, reverse=reverse,
+                   state=state.buf.cast('i'))
+
+
+def _bfs_round(task):
+    """
+    Bottom-up BFS step over one shard: every unvisited vertex in [lo, hi)
+    looks for an in-neighbour on the previous level. Only this shard's
+    entries are written, so shards never race.
+    """
+    lo, hi, level = task
+    in_edges = _worker["reverse"] if _worker["reverse"] is not None else _worker["graph"]
+    in_offsets, in_sources = in_edges.offsets, in_edges.targets
+    state = _worker["state"]
+    n = len(in_edges)
+    distance, parent = state[:n], state[n:]
+    previous = level - 1
+    found = 0
+    for v in range(lo, hi):
+        if distance[v] != -1:
+            continue
+        for u in in_sources[in_offsets[v]:in_offsets[v + 1]]:
+            if distance[u] == previous:
+                distance[v] = level
+                parent[v] = u
+                found += 1
+                break  # Any parent on the previous level will do
+    return found
+
+
+def _label_round(task):
+    """
+    One round of min-label propagation over the shard [lo, hi): each vertex
+    takes the smallest label among itself and its neighbours, then follows
+    that label's own label while it keeps shrinking (pointer jumping).
+    """
+    lo, hi = task
+    graphs = [_worker["graph"]]
+    if _worker["reverse"] is not None:
+        graphs.append(_worker["reverse"])
+    labels = _worker["state"]
+    changed = 0
+    for v in range(lo, hi):
+        best = labels[v]
+        for graph in graphs:
+            offsets, targets = graph.offsets, graph.targets
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                if labels[w] < best:
+                    best = labels[w]
+        while labels[best] < best:
+            best = labels[best]
+        if best < labels[v]:
+            labels[v] = best
+            changed += 1
+    return changed
+
+
+def _run_rounds(graph, reverse, state, workers, make_tasks, step):
+    """
+    Share the graph(s) and state array, then call make_tasks(round) and run
+    step over the tasks in a process pool, round after round, until a round
+    does no work. Returns the final state.
+    """
+    blocks, graph_spec = share_csr(graph)
+    reverse_spec = None
+    if reverse is not None:
+        reverse_blocks, reverse_spec = share_csr(reverse)
+        blocks += reverse_blocks
+    num_bytes = len(state) * state.itemsize
+    shared = shared_memory.SharedMemory(create=True, size=max(state.itemsize, num_bytes))
+    blocks.append(shared)
+    try:
+        shared.buf[:num_bytes] = state.tobytes()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(graph_spec, reverse_spec, shared.name)) as pool:
+            round_number = 1
+            while sum(pool.map(step, make_tasks(round_number))):
+                round_number += 1
+        result = array(state.typecode)
+        result.frombytes(shared.buf[:num_bytes])
+        return result
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def parallel_bfs(graph, start, workers=4, shards=None):
+    """
+    Level-synchronous BFS with the vertices split into shards that are
+    processed by a pool of worker processes.
+
+    Returns (parent, distance) like bfs_levels(). The graph and the
+    distance/parent arrays live in shared memory; in each round every shard
+    runs a bottom-up step for its own vertices against the previous level,
+    so the only exchange between rounds is the shared distance array.
+
+    Notes
+    -----
+    - shards defaults to 4 per worker so a slow shard doesn't hold up a round.
+    - Each round scans every unvisited vertex, so this pays off on large,
+      low-diameter graphs; on long thin graphs bfs_levels() is faster.
+    - With workers <= 1 this is just bfs_levels().
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = csr_from_adjacency_list(graph)
+    if workers <= 1:
+        return bfs_levels(graph, start)
+    n = len(graph)
+    reverse = graph.transpose() if graph.directed else None
+    ranges = partition(graph, shards or workers * 4)
+
+    # State is distance[0:n] followed by parent[0:n]
+    state = array('i', [-1]) * (2 * n)
+    state[start] = 0
+    state = _run_rounds(graph, reverse, state, workers,
+                        lambda level: [(lo, hi, level) for lo, hi in ranges], _bfs_round)
+    return state[n:], state[:n]
+
+
+def parallel_component_labels(graph, workers=4, shards=None):
+    """
+    Connected components by label propagation over shards in a process pool.
+
+    Accepts a graph description or a built graph (adjacency list or
+    CSRGraph; directed graphs give weakly connected components). Returns
+    labels 0..k-1 numbered like component_labels(). Every vertex starts
+    with its own id as label and repeatedly takes the smallest label next
+    to it; when a round changes nothing, each vertex holds the smallest id
+    in its component.
+    """
+    if is_graph_source(graph):
+        graph = csr_graph(graph)
+    elif not isinstance(graph, CSRGraph):
+        graph = csr_from_adjacency_list(graph)
+    if workers <= 1:
+        return component_labels(graph)
+    reverse = graph.transpose() if graph.directed else None
+    ranges = partition(graph, shards or workers * 4)
+
+    labels = _run_rounds(graph, reverse, array('i', range(len(graph))), workers,
+                         lambda _: ranges, _label_round)
+
+    # Renumber 0..k-1 in order of each component's smallest vertex
+    renumbered = array('i', labels)
+    root_label = {}
+    for v, root in enumerate(labels):
+        renumbered[v] = root_label.setdefault(root, len(root_label))
+    return renumbered
+
+
+# --- Test ---
+if __name__ == "__main__":
+    graph_string = """\
+U 7
+0 1
+1 2
+2 3
+0 4
+5 6
+"""
+    adj_list = adjacency_list(graph_string)
+    parent, distance = parallel_bfs(adj_list, 0, workers=2)
+    print(distance.tolist())   # Expected: [0, 1, 2, 3, 1, -1, -1]
+    print(parallel_component_labels(graph_string, workers=2).tolist())
+    # Expected: [0, 0, 0, 0, 0, 1, 1]
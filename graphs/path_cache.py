@@ -0,0 +1,103 @@
+import sys
+from collections import OrderedDict
+
+from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from graphs.bfs import bfs_tree
+from graphs.dijkstra import dijkstra
+
+
+def _result_size(result):
+    """Approximate memory used by a result: its containers and their items."""
+    if isinstance(result, (tuple, list)):
+        return sys.getsizeof(result) + sum(_result_size(item) for item in result)
+    return sys.getsizeof(result)
+
+
+class ShortestPathCache:
+    """
+    Bounded LRU cache of shortest-path trees for one graph.
+
+    Results of dijkstra() and bfs_tree() are kept per source until the cache
+    exceeds max_bytes, at which point the least recently used trees are
+    dropped. Each entry records the graph's version stamp (graph.version,
+    e.g. from DynamicGraph, which bumps it on every edge change); an entry
+    whose stamp is out of date counts as a miss and is recomputed. For
+    graphs without a version attribute call invalidate() after changing them.
+
+    Cached results are shared between callers, so treat them as read-only.
+    """
+    def __init__(self, graph, max_bytes=64 * 1024 * 1024):
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # (kind, source) -> (version, result, size)
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _version(self):
+        return getattr(self.graph, "version", 0)
+
+    def _lookup(self, kind, source, compute):
+        key = (kind, source)
+        version = self._version()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] == version:
+                self.hits += 1
+                self._entries.move_to_end(key)  # Now the most recently used
+                return entry[1]
+            self._drop(key)  # Stale: computed for an older graph
+
+        self.misses += 1
+        result = compute(self.graph, source)
+        size = _result_size(result)
+        if size <= self.max_bytes:
+            self._entries[key] = (version, result, size)
+            self.bytes_used += size
+            # Evict least recently used entries until we fit the budget
+            while self.bytes_used > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return result
+
+    def _drop(self, key):
+        _, _, size = self._entries.pop(key)
+        self.bytes_used -= size
+
+    def dijkstra(self, source):
+        """Cached dijkstra(graph, source); returns (parent, distance)."""
+        return self._lookup("dijkstra", source, dijkstra)
+
+    def bfs_tree(self, source):
+        """Cached bfs_tree(graph, source); returns the parent array."""
+        return self._lookup("bfs_tree", source, bfs_tree)
+
+    def invalidate(self):
+        """Forget every cached result (e.g. after editing an unversioned graph)."""
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        """Counters for monitoring: hits, misses, evictions, entries and bytes."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+        }
+
+
+# --- Test ---
+if __name__ == "__main__":
+    graph_string = """\
+D 3 W
+1 0 3
+2 0 1
+1 2 1
+"""
+    cache = ShortestPathCache(adjacency_list(graph_string))
+    print(cache.dijkstra(1))  # Computed
+    print(cache.dijkstra(1))  # Served from the cache
+    print(cache.stats())      # Expected: 1 hit, 1 miss, 1 entry
@@ -0,0 +1,87 @@
+from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from data_structures.adjacency_matrix import BitMatrix
+from graphs.strongly_connected import condensation, strongly_connected_components
+
+
+class ReachabilityIndex:
+    """
+    Precomputed answers to "can u reach v?" for a directed graph.
+
+    The graph is collapsed into its strongly connected components (all
+    vertices in one component reach each other), and the transitive closure
+    of the condensation DAG is stored as one int bitset per component. A
+    query is then two array lookups and a bit test.
+
+    Notes
+    -----
+    - Build time is O(V + E + C * E_c / 64) word operations and memory
+      C^2 / 8 bytes, where C and E_c are the components and edges of the
+      condensation.
+    - Every vertex reaches itself.
+    """
+    def __init__(self, graph):
+        self.labels, count = strongly_connected_components(graph)
+        dag = condensation(graph, self.labels, count)
+
+        # Labels are in topological order (edges go low -> high), so filling
+        # in from the highest label down sees every successor first.
+        reach = [0] * count
+        for c in range(count - 1, -1, -1):
+            bits = 1 << c
+            for d in dag.neighbours(c):
+                bits |= reach[d]
+            reach[c] = bits
+        self.reach = reach
+
+    def reaches(self, u, v):
+        """True if there is a path from u to v."""
+        return (self.reach[self.labels[u]] >> self.labels[v]) & 1 == 1
+
+    def reaches_many(self, pairs):
+        """Answer a batch of (u, v) queries; returns a list of bools."""
+        reach, labels = self.reach, self.labels
+        return [(reach[labels[u]] >> labels[v]) & 1 == 1 for u, v in pairs]
+
+
+def warshall_closure(graph):
+    """
+    Reflexive transitive closure with Warshall's algorithm on packed rows.
+
+    Follows the same k-i loop as floyd(), but the inner j loop becomes a
+    single OR of two int bitsets. Accepts a BitMatrix or an adjacency list
+    and returns a list of ints: bit v of row u is set iff u reaches v.
+    """
+    n = len(graph)
+    if isinstance(graph, BitMatrix):
+        rows = [graph.row_bits(u) for u in range(n)]
+    else:
+        rows = [0] * n
+        for u in range(n):
+            for v, _ in graph[u]:
+                rows[u] |= 1 << v
+    for u in range(n):
+        rows[u] |= 1 << u  # Every vertex reaches itself
+
+    # Try each vertex as an intermediate point
+    for k in range(n):
+        bit, row_k = 1 << k, rows[k]
+        for i in range(n):
+            if rows[i] & bit:
+                rows[i] |= row_k  # i reaches k, so i reaches all k reaches
+    return rows
+
+
+# --- Test ---
+if __name__ == "__main__":
+    graph_string = """\
+D 4
+0 1
+1 0
+1 2
+"""
+    adj_list = adjacency_list(graph_string)
+    index = ReachabilityIndex(adj_list)
+    print(index.reaches(0, 2), index.reaches(2, 0))       # Expected: True False
+    print(index.reaches_many([(1, 0), (0, 3), (3, 3)]))   # Expected: [True, False, True]
+    print([bin(row) for row in warshall_closure(adj_list)])
+    # Expected: ['0b111', '0b111', '0b100', '0b1000']
@@ -0,0 +1,179 @@
+import heapq
+from data_structures.adjacency_list import adjacency_list  # Import adjacency list builder from sibling package
+from data_structures.csr_graph import CSRGraph
+from graphs.dijkstra import dijkstra
+
+INFINITY = float('inf')
+
+
+def reverse_graph(graph):
+    """Return the graph with every edge reversed (same kind as the input)."""
+    if isinstance(graph, CSRGraph):
+        return graph.transpose()
+    reversed_list = [[] for _ in range(len(graph))]
+    for u in range(len(graph)):
+        for v, weight in graph[u]:
+            reversed_list[v].append((u, weight))
+    return reversed_list
+
+
+class Landmarks:
+    """
+    ALT (A*, landmarks, triangle inequality) lower bounds for A* search.
+
+    Shortest distances to and from a few landmark vertices are computed once
+    with dijkstra(). By the triangle inequality, for any landmark L:
+        d(v, t) >= d(L, t) - d(L, v)   and   d(v, t) >= d(v, L) - d(t, L)
+    so the largest of these is an admissible, consistent heuristic.
+    Instances are called as heuristic(v, t).
+    """
+    def __init__(self, graph, landmarks=None, count=4, reverse=None):
+        if reverse is None:
+            reverse = reverse_graph(graph)
+        if landmarks is None:
+            landmarks = self.choose(graph, count)
+        self.landmarks = list(landmarks)
+        self.from_landmark = [dijkstra(graph, L)[1] for L in self.landmarks]   # d(L, v)
+        self.to_landmark = [dijkstra(reverse, L)[1] for L in self.landmarks]   # d(v, L)
+
+    @staticmethod
+    def choose(graph, count):
+        """
+        Pick landmarks by farthest-point selection: each new landmark is the
+        vertex farthest from all the landmarks chosen so far.
+        """
+        n = len(graph)
+        if n == 0:
+            return []
+        landmarks = [0]
+        nearest = dijkstra(graph, 0)[1]
+        while len(landmarks) < min(count, n):
+            candidates = [v for v in range(n) if nearest[v] != INFINITY and v not in landmarks]
+            if not candidates:
+                break
+            far = max(candidates, key=nearest.__getitem__)
+            landmarks.append(far)
+            nearest = [min(a, b) for a, b in zip(nearest, dijkstra(graph, far)[1])]
+        return landmarks
+
+    def __call__(self, v, t):
+        best = 0
+        for d_from, d_to in zip(self.from_landmark, self.to_landmark):
+            # Only finite distances give a usable bound
+            if d_from[t] != INFINITY and d_from[v] != INFINITY:
+                best = max(best, d_from[t] - d_from[v])
+            if d_to[v] != INFINITY and d_to[t] != INFINITY:
+                best = max(best, d_to[v] - d_to[t])
+        return best
+
+
+def _follow(parent, v):
+    """Walk parent links back from v; returns the vertices from the root to v."""
+    path = [v]
+    while parent[path[-1]] is not None:
+        path.append(parent[path[-1]])
+    return path[::-1]
+
+
+def _a_star(graph, source, target, heuristic):
+    """A* search; with a consistent heuristic each vertex is settled once."""
+    distance = {source: 0}       # Dicts rather than lists, so a query only
+    parent = {source: None}      # touches the vertices it actually explores
+    settled = set()
+    pq = [(heuristic(source, target), source)]
+    while pq:
+        _, u = heapq.heappop(pq)
+        if u in settled:
+            continue
+        if u == target:
+            return _follow(parent, target), distance[target]
+        settled.add(u)
+        d_u = distance[u]
+        for v, weight in graph[u]:
+            new_dist = d_u + weight
+            if new_dist < distance.get(v, INFINITY):
+                distance[v] = new_dist
+                parent[v] = u
+                heapq.heappush(pq, (new_dist + heuristic(v, target), v))
+    return None, INFINITY
+
+
+def _bidirectional(graph, reverse, source, target):
+    """Dijkstra from both ends at once, stopping when the searches meet."""
+    distance = ({source: 0}, {target: 0})      # Forward, backward
+    parent = ({source: None}, {target: None})
+    settled = (set(), set())
+    queues = ([(0, source)], [(0, target)])
+    graphs = (graph, reverse)
+    best, meet = INFINITY, None
+
+    while queues[0] and queues[1]:
+        # The best path can't be improved once the two frontiers together
+        # are already at least as long as it.
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        # Expand whichever side has the smaller queue
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        d_u, u = heapq.heappop(queues[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        dist, other = distance[side], distance[1 - side]
+        for v, weight in graphs[side][u]:
+            new_dist = d_u + weight
+            if new_dist < dist.get(v, INFINITY):
+                dist[v] = new_dist
+                parent[side][v] = u
+                heapq.heappush(queues[side], (new_dist, v))
+            # A path through edge u-v joins the two searches
+            if v in other and new_dist + other[v] < best:
+                best, meet = new_dist + other[v], v
+
+    if meet is None:
+        return None, INFINITY
+    forward = _follow(parent[0], meet)
+    backward = _follow(parent[1], meet)  # Runs target ... meet
+    return forward + backward[::-1][1:], best
+
+
+def shortest_path(graph, source, target, heuristic=None, reverse=None):
+    """
+    Finds a shortest path between two vertices, returning (path, cost).
+
+    path is the list of vertices from source to target, or None (with cost
+    inf) if target can't be reached. Edge weights must be non-negative.
+
+    Notes
+    -----
+    - With no heuristic this runs bidirectional Dijkstra, searching forward
+      from source and backward from target (over reverse, the reversed
+      graph, built here unless passed in) until the two searches meet.
+    - With a heuristic(v, t) giving a lower bound on the distance from v to
+      t, this runs A*. Landmarks(graph) provides such a bound.
+    - Both only explore vertices near the eventual path, rather than
+      settling the whole graph as dijkstra() does.
+    """
+    if source == target:
+        return [source], 0
+    if heuristic is not None:
+        return _a_star(graph, source, target, heuristic)
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    return _bidirectional(graph, reverse, source, target)
+
+
+# --- Test ---
+if __name__ == "__main__":
+    graph_string = """\
+D 5 W
+0 1 2
+1 2 2
+0 3 1
+3 2 5
+2 4 1
+"""
+    adj_list = adjacency_list(graph_string)
+    print(shortest_path(adj_list, 0, 4))                                  # Expected: ([0, 1, 2, 4], 5)
+    print(shortest_path(adj_list, 0, 4, heuristic=Landmarks(adj_list)))  # Expected: ([0, 1, 2, 4], 5)
+    print(shortest_path(adj_list, 4, 0))                                  # Expected: (None, inf)
@@ -1,46 +1,121 @@
+from array import array
+
 from data_structures.adjacency_list import adjacency_list  # Use shared graph parser
+from data_structures.csr_graph import CSRGraph
+
+
+def strongly_connected_components(adj_list):
+    """
+    Finds the strongly connected components of a directed graph using an
+    iterative version of Tarjan's algorithm.
+
+    Returns (labels, count): labels[v] is the component number of vertex v,
+    in 0..count-1. Components are numbered in topological order of the
+    condensation, so every edge between different components goes from a
+    lower label to a higher one.
+
+    Notes
+    -----
+    - Time complexity is O(V + E); state is kept in flat arrays, with no
+      per-vertex sets and no recursion.
+    """
+    n = len(adj_list)
+    index = array('i', [-1]) * n    # Discovery order, -1 = unvisited
+    low = array('i', [0]) * n       # Smallest index reachable via the DFS subtree
+    on_stack = bytearray(n)
+    labels = array('i', [-1]) * n
+    stack = []                      # Tarjan's stack of vertices in open components
+    counter = 0
+    count = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+
+        # DFS call stack as parallel lists of vertices and neighbour iterators
+        vertices = [root]
+        iterators = [iter(adj_list[root])]
+        while iterators:
+            v = vertices[-1]
+            for w, _ in iterators[-1]:
+                if index[w] == -1:
+                    # Tree edge: descend into w
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    vertices.append(w)
+                    iterators.append(iter(adj_list[w]))
+                    break
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]  # Edge back into the current component
+            else:
+                iterators.pop()
+                vertices.pop()
+                if low[v] == index[v]:
+                    # v is the root of a component: pop it off Tarjan's stack
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        labels[w] = count
+                        if w == v:
+                            break
+                    count += 1
+                if vertices and low[v] < low[vertices[-1]]:
+                    low[vertices[-1]] = low[v]
+
+    # Tarjan finishes components in reverse topological order; flip them
+    for v in range(n):
+        labels[v] = count - 1 - labels[v]
+    return labels, count
+
+
+def condensation(adj_list, labels, count):
+    """
+    Builds the condensation DAG: one vertex per strongly connected component
+    and an edge between two components if any edge joins them.
+
+    Takes the (labels, count) from strongly_connected_components() and
+    returns an unweighted, directed CSRGraph with no duplicate edges.
+    """
+    # Group the vertices by component with a counting sort
+    starts = array('q', [0]) * (count + 1)
+    for c in labels:
+        starts[c + 1] += 1
+    for c in range(count):
+        starts[c + 1] += starts[c]
+    members = array('i', [0]) * len(labels)
+    fill = array('q', starts)
+    for v, c in enumerate(labels):
+        members[fill[c]] = v
+        fill[c] += 1
+
+    # Walk one component at a time; last_seen[d] == c means c -> d is recorded
+    offsets = array('q', [0])
+    targets = array('i')
+    last_seen = array('i', [-1]) * count
+    for c in range(count):
+        for i in range(starts[c], starts[c + 1]):
+            for w, _ in adj_list[members[i]]:
+                d = labels[w]
+                if d != c and last_seen[d] != c:
+                    last_seen[d] = c
+                    targets.append(d)
+        offsets.append(len(targets))
+    return CSRGraph(offsets, targets, None, directed=True)
 
 
 def is_strongly_connected(adj_list):
     """
-    Check if a directed graph is strongly connected using two DFS passes.
+    Check if a directed graph is strongly connected, i.e. it forms a single
+    strongly connected component.
     """
-    num_nodes = len(adj_list)
-    if num_nodes == 0:
-        return True  # Vacuously true for empty graph
-
-    # ---------- Pass 1: reachability in the original graph ----------
-    visited = set()
-    stack = [0]  # Start from vertex 0 (arbitrary choice)
-    while stack:
-        node = stack.pop()
-        if node not in visited:
-            visited.add(node)
-            # Add unvisited neighbors
-            neighbors = {nbr for nbr, _ in adj_list[node]}
-            stack.extend(neighbors - visited)
-
-    if len(visited) != num_nodes:
-        return False  # Not all nodes reachable from 0
-
-    # ---------- Build transpose (reverse all edges) ----------
-    transposed = [set() for _ in range(num_nodes)]
-    for u in range(num_nodes):
-        for v, _ in adj_list[u]:
-            transposed[v].add(u)
-
-    # ---------- Pass 2: reachability in the transposed graph ----------
-    visited.clear()
-    stack = [0]
-    while stack:
-        node = stack.pop()
-        if node not in visited:
-            visited.add(node)
-            stack.extend(transposed[node] - visited)
-
-    # If 0 reaches everyone in the transpose, every node can reach 0 in original.
-    # Combined with pass 1, this implies mutual reachability for all pairs.
-    return len(visited) == num_nodes
+    _, count = strongly_connected_components(adj_list)
+    return count <= 1  # Vacuously true for empty graph
 
 
 # --- Test ---
@@ -53,3 +128,9 @@ D 3
 """
     # Expected: False (vertex 2 cannot reach others)
     print(is_strongly_connected(adjacency_list(graph_string)))
+
+    # Components {0, 1} and {2}, with the condensation edge between them
+    labels, count = strongly_connected_components(adjacency_list(graph_string))
+    print(list(labels), count)  # Expected: [0, 0, 1] 2
+    print([list(condensation(adjacency_list(graph_string), labels, count).neighbours(c))
+           for c in range(count)])  # Expected: [[1], []]
@@ -0,0 +1,160 @@
+import heapq
+import os
+import struct
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, count
+
+from sorting.mergesort import merge_sort_bottom_up
+
+DEFAULT_MEMORY_LIMIT = 64 << 20   # Bytes of records held in memory at once
+DEFAULT_FAN_IN = 64               # Most runs merged (files open) at once
+MIN_BUFFER_SIZE = 64 << 10
+LENGTH = struct.Struct("<I")      # Run files store each record as length + bytes
+
+
+def _write_records(records, path, buffer_size):
+    """Write records to path as a run file and return the path."""
+    pack = LENGTH.pack
+    with open(path, "wb", buffering=buffer_size) as run:
+        for record in records:
+            run.write(pack(len(record)))
+            run.write(record)
+    return path
+
+
+def _write_run(records, path, key, reverse, buffer_size):
+    """Sort one in-memory chunk and write it to path as a run file."""
+    merge_sort_bottom_up(records, key=key, reverse=reverse)
+    return _write_records(records, path, buffer_size)
+
+
+def _read_run(path, buffer_size):
+    """Yield the records of a run file in order."""
+    size, unpack = LENGTH.size, LENGTH.unpack
+    with open(path, "rb", buffering=buffer_size) as run:
+        while True:
+            header = run.read(size)
+            if not header:
+                return
+            yield run.read(unpack(header)[0])
+
+
+def _chunks(records, limit):
+    """Group records into lists whose estimated in-memory size stays under limit."""
+    chunk = []
+    used = 0
+    for record in records:
+        chunk.append(record)
+        used += sys.getsizeof(record) + 8   # The record plus its list slot
+        if used >= limit:
+            yield chunk
+            chunk = []
+            used = 0
+    if chunk:
+        yield chunk
+
+
+def _merge_runs(paths, key, reverse, buffer_size):
+    """k-way heap merge of sorted run files (stable: earlier runs win ties)."""
+    return heapq.merge(*(_read_run(path, buffer_size) for path in paths), key=key, reverse=reverse)
+
+
+def external_sort(records, key=None, reverse=False, memory_limit=DEFAULT_MEMORY_LIMIT,
+                  workers=1, tmp_dir=None, fan_in=DEFAULT_FAN_IN):
+    """
+    Sorts an iterable of bytes records that may not fit in memory, yielding
+    them in sorted order.
+
+    Notes
+    -----
+    - Records are read in chunks of about memory_limit bytes; each chunk is
+      sorted with merge_sort_bottom_up() and spilled to a temporary run
+      file (each record stored as a 4-byte length and its bytes).
+    - The runs are then combined by a k-way heap merge, at most fan_in at a
+      time; with more runs than that, groups are merged into longer runs
+      first. Reads and writes go through buffers sized so that all open
+      files together stay within memory_limit.
+    - With workers > 1 chunks are sorted and written by a process pool
+      while the next chunk is read; memory_limit is then shared between
+      the chunks in flight, and key must be picklable (e.g. a module-level
+      function).
+    - Stable. If everything fits in one chunk no files are written.
+    - Temporary files are removed once the result is exhausted or closed.
+    """
+    chunk_limit = memory_limit // (workers + 1) if workers > 1 else memory_limit
+    buffer_size = max(MIN_BUFFER_SIZE, memory_limit // (fan_in + 1))
+    chunks = _chunks(records, chunk_limit)
+
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if second is None:
+        # Everything fit in memory: no runs needed
+        yield from merge_sort_bottom_up(first, key=key, reverse=reverse)
+        return
+    chunks = chain((first, second), chunks)
+    del first, second
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        names = (os.path.join(run_dir, f"run{number}.bin") for number in count())
+
+        # Run generation
+        paths = []
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for chunk in chunks:
+                    if len(pending) >= workers:
+                        paths.append(pending.popleft().result())  # Bound the chunks in flight
+                    pending.append(pool.submit(_write_run, chunk, next(names), key, reverse, buffer_size))
+                paths.extend(future.result() for future in pending)
+        else:
+            for chunk in chunks:
+                paths.append(_write_run(chunk, next(names), key, reverse, buffer_size))
+                chunk.clear()   # Free the records before reading the next chunk
+
+        # Merge groups of fan_in runs until one final merge is left
+        while len(paths) > fan_in:
+            merged_paths = []
+            for i in range(0, len(paths), fan_in):
+                group = paths[i:i + fan_in]
+                merged_paths.append(_write_records(_merge_runs(group, key, reverse, buffer_size),
+                                                   next(names), buffer_size))
+                for old in group:
+                    os.remove(old)
+            paths = merged_paths
+
+        yield from _merge_runs(paths, key, reverse, buffer_size)
+
+
+def sort_file(input_path, output_path, key=None, reverse=False, **options):
+    """
+    Sorts the lines of a (possibly huge) file into output_path using
+    external_sort(); options are passed on to it. A missing newline on the
+    last line is added so every line sorts the same way.
+    """
+    buffer_size = max(MIN_BUFFER_SIZE, options.get("memory_limit", DEFAULT_MEMORY_LIMIT) // 8)
+
+    def lines(infile):
+        for line in infile:
+            yield line if line.endswith(b"\n") else line + b"\n"
+
+    with open(input_path, "rb", buffering=buffer_size) as infile, \
+            open(output_path, "wb", buffering=buffer_size) as outfile:
+        outfile.writelines(external_sort(lines(infile), key=key, reverse=reverse, **options))
+
+
+# --- Simple test ---
+if __name__ == "__main__":
+    import random
+
+    records = [str(random.randrange(10 ** 6)).encode() for _ in range(100000)]
+    # A tiny memory limit forces many runs (and an extra merge pass at fan_in=8)
+    result = list(external_sort(records, key=int, memory_limit=200000, fan_in=8))
+    print("Sorted:", result == sorted(records, key=int))              # Expected: True
+    result = list(external_sort(records, memory_limit=500000, workers=2, reverse=True))
+    print("Parallel, reversed:", result == sorted(records, reverse=True))   # Expected: True
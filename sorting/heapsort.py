@@ -2,22 +2,27 @@ def heapify(arr, n, i):
     """
     Ensures the subtree rooted at index i satisfies the max-heap property.
     """
-    largest = i           # Assume the root is the largest
-    left = 2 * i + 1       # Left child index
-    right = 2 * i + 2      # Right child index
+    root = arr[i]          # Value being sifted down; the hole starts at i
 
-    # If left child exists and is greater than root
-    if left < n and arr[left] > arr[largest]:
+    while True:
+        left = 2 * i + 1       # Left child index
+        if left >= n:
+            break
         largest = left
 
-    # If right child exists and is greater than the largest so far
-    if right < n and arr[right] > arr[largest]:
-        largest = right
+        # If right child exists and is greater than the left one
+        if left + 1 < n and arr[left + 1] > arr[left]:
+            largest = left + 1
 
-    # If largest is not root, swap and continue heapifying
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+        # Stop once the root value is at least as large as both children
+        if not arr[largest] > root:
+            break
+
+        # Move the larger child up into the hole and continue below it
+        arr[i] = arr[largest]
+        i = largest
+
+    arr[i] = root
 
 
 def heapsort(arr):
@@ -43,9 +48,325 @@ def heapsort(arr):
 
     return arr
 
+
+def heapsort_range(keys, lo, hi, values=None):
+    """
+    Sorts keys[lo:hi] in place with an iterative max-heap, applying the same
+    moves to values (if given) so a parallel list stays aligned with its
+    keys. Used by introsort as its worst-case fallback.
+    """
+    n = hi - lo
+
+    def sift_down(i, size):
+        # Move the hole down instead of swapping at every level
+        key = keys[lo + i]
+        value = values[lo + i] if values is not None else None
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[lo + child] < keys[lo + child + 1]:
+                child += 1
+            if not key < keys[lo + child]:
+                break
+            keys[lo + i] = keys[lo + child]
+            if values is not None:
+                values[lo + i] = values[lo + child]
+            i = child
+        keys[lo + i] = key
+        if values is not None:
+            values[lo + i] = value
+
+    # Build a max heap, then move the root to the end of the shrinking heap
+    for i in range(n // 2 - 1, -1, -1):
+        sift_down(i, n)
+    for end in range(n - 1, 0, -1):
+        keys[lo], keys[lo + end] = keys[lo + end], keys[lo]
+        if values is not None:
+            values[lo], values[lo + end] = values[lo + end], values[lo]
+        sift_down(0, end)
+
+
+def _sift_up(keys, values, i, arity):
+    """Move keys[i] up a min-heap (values, if not None, move alongside)."""
+    key = keys[i]
+    value = values[i] if values is not None else None
+    while i > 0:
+        parent = (i - 1) // arity
+        if not key < keys[parent]:
+            break
+        keys[i] = keys[parent]
+        if values is not None:
+            values[i] = values[parent]
+        i = parent
+    keys[i] = key
+    if values is not None:
+        values[i] = value
+
+
+def _sift_down(keys, values, i, arity):
+    """Move keys[i] down a min-heap (values, if not None, move alongside)."""
+    n = len(keys)
+    key = keys[i]
+    value = values[i] if values is not None else None
+    while True:
+        first = arity * i + 1
+        if first >= n:
+            break
+        # Find the smallest of up to arity children
+        best, best_key = first, keys[first]
+        for child in range(first + 1, min(first + arity, n)):
+            if keys[child] < best_key:
+                best, best_key = child, keys[child]
+        if not best_key < key:
+            break
+        keys[i] = best_key
+        if values is not None:
+            values[i] = values[best]
+        i = best
+    keys[i] = key
+    if values is not None:
+        values[i] = value
+
+
+def build_heap(heap, arity=2):
+    """Rearrange a list into a min-heap in place, in O(n) time."""
+    for i in range((len(heap) - 2) // arity, -1, -1):
+        _sift_down(heap, None, i, arity)
+    return heap
+
+
+def heap_push(heap, item, arity=2):
+    """Push item onto a min-heap list (like heapq.heappush)."""
+    heap.append(item)
+    _sift_up(heap, None, len(heap) - 1, arity)
+
+
+def heap_pop(heap, arity=2):
+    """Pop and return the smallest item of a min-heap list (like heapq.heappop)."""
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    heap[0] = last
+    _sift_down(heap, None, 0, arity)
+    return top
+
+
+class Heap:
+    """
+    Min-heap priority queue with an optional key function and arity.
+
+    With a key, each item's key is computed once when it is added and kept
+    in a list parallel to the items, so items themselves never need to be
+    comparable. Higher arity makes the tree shallower: pushes get cheaper
+    and pops compare more children per level.
+    """
+    def __init__(self, items=(), key=None, arity=2):
+        self.key = key
+        self.arity = arity
+        self.items = list(items)
+        self.keys = None if key is None else [key(x) for x in self.items]
+        # Build the heap bottom-up in O(n)
+        for i in range((len(self.items) - 2) // arity, -1, -1):
+            _sift_down(*self._lists(), i, arity)
+
+    def _lists(self):
+        """(keys, values) as the sift helpers expect them."""
+        if self.keys is None:
+            return self.items, None
+        return self.keys, self.items
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, item):
+        self.items.append(item)
+        if self.keys is not None:
+            self.keys.append(self.key(item))
+        _sift_up(*self._lists(), len(self.items) - 1, self.arity)
+
+    def peek(self):
+        """The smallest item, without removing it."""
+        return self.items[0]
+
+    def pop(self):
+        """Remove and return the smallest item."""
+        keys, values = self._lists()
+        last_key = keys.pop()
+        last = values.pop() if values is not None else last_key
+        if not self.items:
+            return last
+        top = self.items[0]
+        keys[0] = last_key
+        if values is not None:
+            values[0] = last
+        _sift_down(keys, values, 0, self.arity)
+        return top
+
+
+class IndexedHeap:
+    """
+    Indexed d-ary min-heap of handles (ints 0..num_handles-1, e.g. vertex
+    ids), each with a priority.
+
+    Each handle appears at most once; `position[h]` records where it sits
+    in the heap so its priority can be lowered in place (decrease-key) or
+    the entry removed, instead of pushing duplicates.
+    """
+    def __init__(self, num_handles, arity=2):
+        self.arity = arity
+        self.heap = []                       # Handles in heap order
+        self.keys = []                       # keys[i] is the priority of heap[i]
+        self.position = [-1] * num_handles   # -1 means "not in the heap"
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, handle):
+        return self.position[handle] != -1
+
+    def priority(self, handle):
+        """Current priority of a handle in the heap."""
+        return self.keys[self.position[handle]]
+
+    def push(self, handle, priority):
+        """Insert a handle that is not in the heap yet."""
+        if self.position[handle] != -1:
+            raise ValueError(f"Handle {handle} is already in the heap.")
+        self.heap.append(handle)
+        self.keys.append(priority)
+        self._sift_up(len(self.heap) - 1, handle, priority)
+
+    def decrease_key(self, handle, priority):
+        """Lower the priority of a handle that is in the heap."""
+        i = self.position[handle]
+        if i == -1:
+            raise KeyError(handle)
+        if self.keys[i] < priority:
+            raise ValueError("decrease_key cannot raise a priority.")
+        self._sift_up(i, handle, priority)
+
+    def push_or_decrease(self, handle, priority):
+        """Insert handle with the given priority, or lower its priority if already present."""
+        i = self.position[handle]
+        if i == -1:
+            i = len(self.heap)
+            self.heap.append(handle)
+            self.keys.append(priority)
+        elif priority >= self.keys[i]:
+            return
+        self._sift_up(i, handle, priority)
+
+    def peek(self):
+        """(priority, handle) with the smallest priority, without removing it."""
+        return self.keys[0], self.heap[0]
+
+    def pop(self):
+        """Remove and return (priority, handle) with the smallest priority."""
+        heap, keys = self.heap, self.keys
+        top, top_key = heap[0], keys[0]
+        self.position[top] = -1
+        last, last_key = heap.pop(), keys.pop()
+        if heap:
+            self._sift_down(0, last, last_key)
+        return top_key, top
+
+    def remove(self, handle):
+        """Remove a handle from the heap and return its priority."""
+        i = self.position[handle]
+        if i == -1:
+            raise KeyError(handle)
+        heap, keys = self.heap, self.keys
+        priority = keys[i]
+        self.position[handle] = -1
+        last, last_key = heap.pop(), keys.pop()
+        if i < len(heap):
+            # Put the last entry in the gap; it may belong above or below it
+            if i > 0 and last_key < keys[(i - 1) // self.arity]:
+                self._sift_up(i, last, last_key)
+            else:
+                self._sift_down(i, last, last_key)
+        return priority
+
+    def _sift_up(self, i, handle, key):
+        heap, keys, position, d = self.heap, self.keys, self.position, self.arity
+        # Move parents down until the handle's slot is found (hole technique, no swaps)
+        while i > 0:
+            p = (i - 1) // d
+            if keys[p] <= key:
+                break
+            heap[i], keys[i] = heap[p], keys[p]
+            position[heap[i]] = i
+            i = p
+        heap[i], keys[i] = handle, key
+        position[handle] = i
+
+    def _sift_down(self, i, handle, key):
+        heap, keys, position, d = self.heap, self.keys, self.position, self.arity
+        n = len(heap)
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            # Find the smallest of up to d children
+            best = first
+            best_key = keys[first]
+            for c in range(first + 1, min(first + d, n)):
+                if keys[c] < best_key:
+                    best, best_key = c, keys[c]
+            if best_key >= key:
+                break
+            heap[i], keys[i] = heap[best], best_key
+            position[heap[i]] = i
+            i = best
+        heap[i], keys[i] = handle, key
+        position[handle] = i
+
+
 # --- Simple test ---
 if __name__ == "__main__":
     test_data = [3, 6, 8, 10, 1, 2, 1]
     print("Original:", test_data)
     sorted_data = heapsort(test_data)
     print("Sorted:", sorted_data)
+
+    queue = Heap(["pear", "fig", "banana"], key=len)
+    print("Shortest first:", queue.pop(), queue.pop())   # Expected: fig pear
+
+    indexed = IndexedHeap(3)
+    indexed.push(0, 5)
+    indexed.push(1, 7)
+    indexed.push(2, 9)
+    indexed.decrease_key(2, 1)
+    indexed.remove(0)
+    print("Indexed:", indexed.pop(), indexed.pop())      # Expected: (1, 2) (7, 1)
+
+    # Benchmark against heapq (a C extension) on the same push/pop workload
+    import heapq
+    import random
+    import time
+
+    values = [random.random() for _ in range(200000)]
+
+    def push_pop(push, pop, make):
+        heap = make()
+        began = time.perf_counter()
+        for v in values:
+            push(heap, v)
+        while heap:
+            pop(heap)
+        return time.perf_counter() - began
+
+    print(f"heapq:           {push_pop(heapq.heappush, heapq.heappop, list):.3f}s")
+    for arity in (2, 4):
+        print(f"heap_push/pop {arity}: "
+              f"{push_pop(lambda h, v: heap_push(h, v, arity), lambda h: heap_pop(h, arity), list):.3f}s")
+    print(f"Heap class:      {push_pop(Heap.push, Heap.pop, Heap):.3f}s")
+
+    began = time.perf_counter()
+    heapq.heapify(list(values))
+    print(f"heapq.heapify:   {time.perf_counter() - began:.3f}s")
+    began = time.perf_counter()
+    build_heap(list(values))
+    print(f"build_heap:      {time.perf_counter() - began:.3f}s")
@@ -1,26 +1,26 @@
-def key_positions(seq, key):
+def key_positions(seq, key=None):
     """
     Computes the starting index positions for each key value in a stable counting sort.
+
+    Keys must be non-negative ints (key defaults to the element itself).
+    Makes a single pass over seq, so any iterable works, and calls key
+    once per element.
     """
-    # Step 1: Find the maximum key value
-    k = max(key(x) for x in seq)
-    
-    # Step 2: Create and initialize C array
-    C = [0] * (k + 1)
-    
-    # Step 3: Count occurrences of each key
+    # Step 1: Count occurrences of each key, growing C as larger keys appear
+    C = []
     for x in seq:
-        C[key(x)] += 1
-    
-    # Step 4: Cumulative sum to find starting positions
-    for i in range(1, len(C)):
-        C[i] += C[i-1]
-    
-    # Step 5: Shift C right by one position
-    for i in range(len(C)-1, 0, -1):
-        C[i] = C[i-1]
-    C[0] = 0
-    
+        k = x if key is None else key(x)
+        if k < 0:
+            raise ValueError(f"Negative key {k!r}; key_positions needs keys >= 0.")
+        if k >= len(C):
+            C.extend([0] * (k + 1 - len(C)))
+        C[k] += 1
+
+    # Step 2: Exclusive cumulative sum: C[k] becomes the number of smaller keys
+    total = 0
+    for k in range(len(C)):
+        C[k], total = total, total + C[k]
+
     return C
 
 
@@ -32,3 +32,4 @@ if __name__ == "__main__":
     result = key_positions(range(-3, 3), lambda x: x**2)
     print("Starting positions:", result)
     # Expected: key 0 starts at index 0, key 1 starts at 1, key 4 starts at 3, key 9 starts at 5
+    print("From an iterator:", key_positions(iter([2, 0, 2])))   # Expected: [0, 1, 1]
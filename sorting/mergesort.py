@@ -1,3 +1,11 @@
+from bisect import bisect_left, bisect_right
+
+# Natural runs shorter than this are extended with binary insertion sort
+MIN_RUN = 32
+# After this many wins in a row from one side, merge switches to galloping
+MIN_GALLOP = 7
+
+
 def merge_sort(arr):
     """
     Sorts a list using the Merge Sort algorithm.
@@ -7,6 +15,7 @@ def merge_sort(arr):
     - Merge Sort is a divide-and-conquer algorithm.
     - Time complexity is O(n log n) for all cases.
     - Not in-place: uses extra space proportional to the list size.
+    - Slices the list at every level; merge_sort_bottom_up() avoids that.
     """
     if len(arr) <= 1:
         return arr  # Base case: already sorted
@@ -23,18 +32,33 @@ def merge_sort(arr):
 def merge(left, right):
     """
     Merges two sorted lists into one sorted list.
+
+    Stable (ties are taken from left first). Once one side has won
+    MIN_GALLOP comparisons in a row, the rest of its winning stretch is
+    found by binary search and copied in one go.
     """
     merged = []
     i = j = 0
+    left_wins = right_wins = 0
 
     # Compare elements from both lists and add the smallest
     while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            merged.append(left[i])
-            i += 1
-        else:
+        if right[j] < left[i]:
             merged.append(right[j])
             j += 1
+            right_wins, left_wins = right_wins + 1, 0
+            if right_wins >= MIN_GALLOP:
+                end = bisect_left(right, left[i], j)
+                merged.extend(right[j:end])
+                j, right_wins = end, 0
+        else:
+            merged.append(left[i])
+            i += 1
+            left_wins, right_wins = left_wins + 1, 0
+            if left_wins >= MIN_GALLOP:
+                end = bisect_right(left, right[j], i)
+                merged.extend(left[i:end])
+                i, left_wins = end, 0
 
     # Add remaining elements (only one of these will run)
     merged.extend(left[i:])
@@ -42,9 +66,153 @@ def merge(left, right):
     return merged
 
 
+def _find_runs(keys, values):
+    """
+    Splits keys into natural runs, in place: strictly descending runs are
+    reversed, and runs shorter than MIN_RUN are extended by binary
+    insertion. values (if not None) is rearranged alongside. Returns the
+    run boundaries [0, ..., len(keys)].
+    """
+    n = len(keys)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        end = lo + 1
+        if end < n and keys[end] < keys[lo]:
+            # Strictly descending, so reversing it keeps the sort stable
+            while end < n and keys[end] < keys[end - 1]:
+                end += 1
+            keys[lo:end] = keys[lo:end][::-1]
+            if values is not None:
+                values[lo:end] = values[lo:end][::-1]
+        else:
+            while end < n and not keys[end] < keys[end - 1]:
+                end += 1
+
+        # Extend a short run with binary insertion sort
+        stop = min(lo + MIN_RUN, n)
+        for i in range(end, stop):
+            key = keys[i]
+            pos = bisect_right(keys, key, lo, i)
+            if pos < i:
+                keys[pos + 1:i + 1] = keys[pos:i]
+                keys[pos] = key
+                if values is not None:
+                    value = values[i]
+                    values[pos + 1:i + 1] = values[pos:i]
+                    values[pos] = value
+        lo = max(end, stop)
+        bounds.append(lo)
+    return bounds
+
+
+def _merge_runs(src, src_values, dst, dst_values, lo, mid, hi):
+    """
+    Merges the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi],
+    galloping like merge(). The *_values lists (if not None) follow along.
+    """
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            if dst_values is not None:
+                dst_values[k] = src_values[j]
+            j += 1
+            k += 1
+            right_wins, left_wins = right_wins + 1, 0
+            if right_wins >= MIN_GALLOP and j < hi:
+                end = bisect_left(src, src[i], j, hi)
+                dst[k:k + end - j] = src[j:end]
+                if dst_values is not None:
+                    dst_values[k:k + end - j] = src_values[j:end]
+                k += end - j
+                j, right_wins = end, 0
+        else:
+            dst[k] = src[i]
+            if dst_values is not None:
+                dst_values[k] = src_values[i]
+            i += 1
+            k += 1
+            left_wins, right_wins = left_wins + 1, 0
+            if left_wins >= MIN_GALLOP and i < mid:
+                end = bisect_right(src, src[j], i, mid)
+                dst[k:k + end - i] = src[i:end]
+                if dst_values is not None:
+                    dst_values[k:k + end - i] = src_values[i:end]
+                k += end - i
+                i, left_wins = end, 0
+
+    # Copy whichever run is left over
+    for start, stop in ((i, mid), (j, hi)):
+        dst[k:k + stop - start] = src[start:stop]
+        if dst_values is not None:
+            dst_values[k:k + stop - start] = src_values[start:stop]
+        k += stop - start
+
+
+def merge_sort_bottom_up(arr, key=None, reverse=False):
+    """
+    Sorts a list in place with an iterative, run-aware merge sort and
+    returns it.
+
+    Notes
+    -----
+    - Finds the natural ascending/descending runs first, so already (or
+      nearly) sorted input takes close to O(n) time; the worst case is
+      O(n log n).
+    - Adjacent runs are merged pass by pass, back and forth between arr
+      and one auxiliary list allocated up front; no slicing into halves.
+    - Merges gallop: a long stretch won by one run is located by binary
+      search and copied in bulk.
+    - Stable. With a key function each key is computed once, and the
+      keys get their own auxiliary list. reverse=True keeps equal
+      elements in their original order, as sorted() does.
+    """
+    if reverse:
+        arr.reverse()   # Sorting ascending then reversing keeps ties stable
+    if key is None:
+        keys, values = arr, None
+    else:
+        keys, values = [key(x) for x in arr], arr
+
+    bounds = _find_runs(keys, values)
+    if len(bounds) > 2:
+        src, src_values = keys, values
+        dst = [None] * len(keys)
+        dst_values = None if values is None else [None] * len(values)
+        while len(bounds) > 2:
+            merged = [0]
+            for r in range(0, len(bounds) - 1, 2):
+                lo = bounds[r]
+                if r + 2 < len(bounds):
+                    mid, hi = bounds[r + 1], bounds[r + 2]
+                    _merge_runs(src, src_values, dst, dst_values, lo, mid, hi)
+                else:
+                    # Odd run out: carried over to the next pass unchanged
+                    hi = bounds[r + 1]
+                    dst[lo:hi] = src[lo:hi]
+                    if dst_values is not None:
+                        dst_values[lo:hi] = src_values[lo:hi]
+                merged.append(hi)
+            bounds = merged
+            src, src_values, dst, dst_values = dst, dst_values, src, src_values
+        if values is None and src is not arr:
+            arr[:] = src
+        elif values is not None and src_values is not arr:
+            arr[:] = src_values
+
+    if reverse:
+        arr.reverse()
+    return arr
+
+
 # --- Simple test ---
 if __name__ == "__main__":
     test_data = [3, 6, 8, 10, 1, 2, 1]
     print("Original:", test_data)
     sorted_data = merge_sort(test_data)
     print("Sorted:", sorted_data)
+    print("Bottom-up:", merge_sort_bottom_up(list(test_data)))   # Expected: [1, 1, 2, 3, 6, 8, 10]
+    print("By key, reversed:", merge_sort_bottom_up(["b", "aa", "c", "dd"], key=len, reverse=True))
+    # Expected: ['aa', 'dd', 'b', 'c']
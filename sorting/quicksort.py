@@ -1,3 +1,11 @@
+from sorting.heapsort import heapsort_range
+
+# Ranges this short are finished with insertion sort
+INSERTION_THRESHOLD = 16
+# Ranges longer than this pick their pivot as Tukey's ninther
+NINTHER_THRESHOLD = 128
+
+
 def quicksort(arr):
     """
     Sorts a list using the Quicksort algorithm.
@@ -8,6 +16,7 @@ def quicksort(arr):
     - The pivot is chosen as the middle element for simplicity.
     - The algorithm has an average time complexity of O(n log n),
       but worst-case complexity of O(n^2) if the pivot choice is poor.
+    - Builds new lists at every level; introsort() sorts in place instead.
     """
     if len(arr) <= 1:
         return arr  # Base case: already sorted
@@ -19,9 +28,119 @@ def quicksort(arr):
         return quicksort(left) + middle + quicksort(right)
 
 
+def _median_of_three(keys, a, b, c):
+    """Index of the median of keys[a], keys[b] and keys[c]."""
+    if keys[a] < keys[b]:
+        if keys[b] < keys[c]:
+            return b
+        return c if keys[a] < keys[c] else a
+    if keys[a] < keys[c]:
+        return a
+    return c if keys[b] < keys[c] else b
+
+
+def _insertion_sort(keys, values, lo, hi):
+    """Sorts keys[lo:hi] (and values alongside) by insertion."""
+    for i in range(lo + 1, hi):
+        key = keys[i]
+        if not key < keys[i - 1]:
+            continue  # Already in place
+        value = values[i] if values is not None else None
+        j = i
+        while j > lo and key < keys[j - 1]:
+            keys[j] = keys[j - 1]
+            if values is not None:
+                values[j] = values[j - 1]
+            j -= 1
+        keys[j] = key
+        if values is not None:
+            values[j] = value
+
+
+def _introsort(keys, values, lo, hi, depth):
+    """Sorts keys[lo:hi] in place, moving values (if not None) alongside."""
+    while hi - lo > INSERTION_THRESHOLD:
+        if depth == 0:
+            # Too many bad pivots: finish this range in guaranteed O(n log n)
+            heapsort_range(keys, lo, hi, values)
+            return
+        depth -= 1
+
+        # Choose the pivot and move it to the (lower) middle, where Hoare
+        # partitioning is guaranteed to leave both sides non-empty
+        mid = lo + (hi - 1 - lo) // 2
+        if hi - lo > NINTHER_THRESHOLD:
+            step = (hi - lo) // 8
+            p = _median_of_three(keys,
+                                 _median_of_three(keys, lo, lo + step, lo + 2 * step),
+                                 _median_of_three(keys, mid - step, mid, mid + step),
+                                 _median_of_three(keys, hi - 1 - 2 * step, hi - 1 - step, hi - 1))
+        else:
+            p = _median_of_three(keys, lo, mid, hi - 1)
+        keys[p], keys[mid] = keys[mid], keys[p]
+        if values is not None:
+            values[p], values[mid] = values[mid], values[p]
+        pivot = keys[mid]
+
+        # Hoare partition: afterwards keys[lo:j+1] <= pivot <= keys[j+1:hi]
+        i, j = lo - 1, hi
+        while True:
+            i += 1
+            while keys[i] < pivot:
+                i += 1
+            j -= 1
+            while pivot < keys[j]:
+                j -= 1
+            if i >= j:
+                break
+            keys[i], keys[j] = keys[j], keys[i]
+            if values is not None:
+                values[i], values[j] = values[j], values[i]
+
+        # Recurse into the smaller side and loop on the larger one, so the
+        # stack never grows past O(log n) frames
+        if j + 1 - lo < hi - j - 1:
+            _introsort(keys, values, lo, j + 1, depth)
+            lo = j + 1
+        else:
+            _introsort(keys, values, j + 1, hi, depth)
+            hi = j + 1
+    _insertion_sort(keys, values, lo, hi)
+
+
+def introsort(arr, key=None, reverse=False):
+    """
+    Sorts a list in place using introsort and returns it.
+
+    Notes
+    -----
+    - Quicksort with Hoare partitioning around a median-of-three pivot
+      (Tukey's ninther on large ranges), finishing short ranges with
+      insertion sort.
+    - If the recursion gets deeper than 2 * log2(n), the range is handed to
+      heapsort instead, so the worst case is O(n log n) rather than O(n^2).
+    - No lists are built while sorting. With a key function each key is
+      computed once and kept in one parallel list that is rearranged
+      together with arr.
+    - Not stable. reverse=True sorts ascending and then reverses.
+    """
+    n = len(arr)
+    if key is None:
+        keys, values = arr, None
+    else:
+        keys, values = [key(x) for x in arr], arr
+    _introsort(keys, values, 0, n, 2 * n.bit_length())
+    if reverse:
+        arr.reverse()
+    return arr
+
+
 # --- Simple test ---
 if __name__ == "__main__":
     test_data = [3, 6, 8, 10, 1, 2, 1]
     print("Original:", test_data)
     sorted_data = quicksort(test_data)
     print("Sorted:", sorted_data)
+    print("Introsort:", introsort(list(test_data)))                  # Expected: [1, 1, 2, 3, 6, 8, 10]
+    print("By key, reversed:", introsort(["bb", "a", "ccc"], key=len, reverse=True))
+    # Expected: ['ccc', 'bb', 'a']
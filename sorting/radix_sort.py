@@ -0,0 +1,169 @@
+from sorting.key_positions import key_positions
+from sorting.mergesort import merge_sort_bottom_up
+
+HAS_NUMPY = True
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+
+# LSD radix sort works on one byte of the key per pass
+DIGIT_BITS = 8
+DIGIT_MASK = (1 << DIGIT_BITS) - 1
+# The NumPy path takes 16 bits per pass, since each pass runs in C
+NUMPY_DIGIT_BITS = 16
+NUMPY_DIGIT_MASK = (1 << NUMPY_DIGIT_BITS) - 1
+# MSD groups this small are finished with a comparison sort
+MSD_SMALL_GROUP = 32
+
+
+def _distribute(items, keys, digits):
+    """
+    One stable counting-sort pass: returns (items, keys) reordered by the
+    parallel list of small non-negative ints in digits.
+    """
+    positions = key_positions(digits)
+    sorted_items = [None] * len(items)
+    sorted_keys = [None] * len(keys)
+    for item, k, digit in zip(items, keys, digits):
+        i = positions[digit]
+        sorted_items[i] = item
+        sorted_keys[i] = k
+        positions[digit] = i + 1
+    return sorted_items, sorted_keys
+
+
+def counting_sort(seq, key=None):
+    """
+    Sorts by int keys with a narrow range with a stable counting sort and
+    returns a new list.
+
+    Notes
+    -----
+    - Keys are shifted so the smallest is 0 (so negative keys work), then
+      key_positions() gives where each key's elements start and one more
+      pass drops every element into place.
+    - Time and extra space are O(n + k) for a key range of k; each key is
+      computed once.
+    """
+    items = list(seq)
+    keys = items if key is None else [key(x) for x in items]
+    if not items:
+        return items
+    low = min(keys)
+    return _distribute(items, keys, [k - low for k in keys])[0]
+
+
+def _radix_sort_numpy(arr):
+    """LSD radix sort of a NumPy integer array, 16 bits per pass."""
+    if arr.size == 0:
+        return arr.copy()
+    # Shift so the smallest value is 0; uint64 arithmetic wraps, so the
+    # differences are exact even for the full int64 range
+    if arr.dtype.kind == "u":
+        shifted = arr.astype(np.uint64) - np.uint64(arr.min())
+    else:
+        shifted = (arr.astype(np.int64) - np.int64(arr.min())).view(np.uint64)
+    width = int(shifted.max()).bit_length()
+
+    order = np.arange(arr.size)
+    for shift in range(0, width, NUMPY_DIGIT_BITS):
+        digits = ((shifted[order] >> np.uint64(shift)) & np.uint64(NUMPY_DIGIT_MASK)).astype(np.uint16)
+        if np.bincount(digits).max() == arr.size:
+            continue  # Every element has the same digit: nothing moves
+        # NumPy's stable sort of 16-bit values is itself a counting sort
+        # (histogram, prefix sums, scatter), run in C
+        order = order[np.argsort(digits, kind="stable")]
+    return arr[order]
+
+
+def radix_sort(seq, key=None):
+    """
+    Sorts by int keys (negative ones included) with a stable LSD radix sort,
+    returning a new list (or a new array for a NumPy integer array).
+
+    Notes
+    -----
+    - Keys are shifted so the smallest is 0, then sorted one byte at a time
+      from the lowest byte up, each pass a stable counting sort, so the
+      time is O(n * w) for w-byte keys.
+    - Passes where every key has the same byte are skipped.
+    - A NumPy integer array (with no key) is sorted with vectorised
+      passes of 16 bits each instead of Python loops.
+    """
+    if HAS_NUMPY and isinstance(seq, np.ndarray) and key is None and seq.dtype.kind in "iu":
+        return _radix_sort_numpy(seq)
+
+    items = list(seq)
+    keys = items if key is None else [key(x) for x in items]
+    if not items:
+        return items
+    low = min(keys)
+    keys = [k - low for k in keys]
+    for shift in range(0, max(keys).bit_length(), DIGIT_BITS):
+        digits = [(k >> shift) & DIGIT_MASK for k in keys]
+        if digits.count(digits[0]) == len(digits):
+            continue
+        items, keys = _distribute(items, keys, digits)
+    return items
+
+
+def msd_radix_sort(seq, key=None):
+    """
+    Sorts strings (or bytes) with a stable MSD radix sort, returning a new
+    list.
+
+    Notes
+    -----
+    - Groups the elements by their first character, then each group by
+      its second character, and so on, working through an explicit stack.
+      A string that ends at the current position goes before the rest of
+      its group.
+    - Only the characters needed to tell strings apart are looked at,
+      so long shared prefixes are the expensive case.
+    - Groups of at most MSD_SMALL_GROUP elements are finished with
+      merge_sort_bottom_up().
+    """
+    items = list(seq)
+    keys = items if key is None else [key(x) for x in items]
+    order = list(range(len(items)))
+
+    stack = [(0, len(order), 0)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= MSD_SMALL_GROUP:
+            # All share their first depth characters, so comparing whole keys is fine
+            order[lo:hi] = merge_sort_bottom_up(order[lo:hi], key=keys.__getitem__)
+            continue
+
+        ended = []
+        buckets = {}
+        for i in order[lo:hi]:
+            k = keys[i]
+            if len(k) == depth:
+                ended.append(i)
+            else:
+                buckets.setdefault(k[depth], []).append(i)
+
+        order[lo:lo + len(ended)] = ended
+        position = lo + len(ended)
+        for char in sorted(buckets):
+            bucket = buckets[char]
+            order[position:position + len(bucket)] = bucket
+            if len(bucket) > 1:
+                stack.append((position, position + len(bucket), depth + 1))
+            position += len(bucket)
+
+    return [items[i] for i in order]
+
+
+# --- Simple test ---
+if __name__ == "__main__":
+    test_data = [3, 6, 8, 10, 1, 2, 1]
+    print("Counting sort:", counting_sort(test_data))              # Expected: [1, 1, 2, 3, 6, 8, 10]
+    print("With negatives:", counting_sort([3, -1, 2, 0]))         # Expected: [-1, 0, 2, 3]
+    print("Radix sort:", radix_sort([70000, -5, 3, -70000, 0]))    # Expected: [-70000, -5, 0, 3, 70000]
+    print("MSD radix sort:", msd_radix_sort(["banana", "band", "ban", "apple"]))
+    # Expected: ['apple', 'ban', 'banana', 'band']
+    if HAS_NUMPY:
+        print("NumPy:", radix_sort(np.array(test_data)).tolist())   # Expected: [1, 1, 2, 3, 6, 8, 10]